@@ -0,0 +1,6 @@
+# Prompt List
+prompt_list = [
+    'This is a test prompt',
+    "Another test prompt with 'quotes'",
+    'Simple prompt',
+]
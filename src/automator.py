@@ -136,17 +136,24 @@ def run_with_timeout(func, timeout: float, *args, **kwargs):
 # Thread pool functions removed - simplified architecture
 
 
-def paste_text_safely(text: str) -> bool:
-    """Safely copy text to clipboard with verification and timeout protection."""
+def paste_text_safely(text: str, *, clip=None, sleep=None) -> bool:
+    """Safely copy text to clipboard with verification and timeout protection.
+
+    ``clip`` and ``sleep`` default to ``pyperclip`` and ``time.sleep``; tests
+    pass fakes instead of patching the module globals.
+    """
     if text is None or text == "":
         return False
 
+    clip = clip or pyperclip
+    sleep = sleep or time.sleep
+
     def clipboard_operation():
         for attempt in range(CLIPBOARD_RETRY_ATTEMPTS):
             try:
-                pyperclip.copy(text)
-                time.sleep(CLIPBOARD_RETRY_DELAY)
-                clipboard_text = pyperclip.paste().strip()
+                clip.copy(text)
+                sleep(CLIPBOARD_RETRY_DELAY)
+                clipboard_text = clip.paste().strip()
                 expected_text = text.strip()
 
                 # More flexible comparison - check if the text is contained
@@ -178,12 +185,18 @@ def paste_text_safely(text: str) -> bool:
     return result if result is not None else False
 
 
-def click_with_timeout(coords: Tuple[int, int], timeout: float = CLICK_TIMEOUT) -> bool:
-    """Click with timeout protection."""
+def click_with_timeout(
+    coords: Tuple[int, int],
+    timeout: float = CLICK_TIMEOUT,
+    *,
+    pag=None,
+) -> bool:
+    """Click with timeout protection (``pag`` defaults to ``pyautogui``)."""
+    pag = pag or pyautogui
 
     def click_operation():
         try:
-            pyautogui.click(*coords)
+            pag.click(*coords)
             return True
         except Exception as e:
             logger.error(f"Click operation failed: {e}")
@@ -199,8 +212,10 @@ def click_button_or_fallback(
     win: CursorWindow,
     coords: Tuple[int, int],
     pattern: str,
+    *,
+    pag=None,
 ) -> bool:
-    """Click button with fallback and timeout protection."""
+    """Click button with fallback and timeout protection (``pag`` defaults to ``pyautogui``)."""
 
     logger.info(f"Attempting to click button at coordinates {coords} "
                f"with pattern '{pattern}'")
@@ -214,7 +229,7 @@ def click_button_or_fallback(
                     if not win.connect():
                         logger.info("Window connection failed, falling back to "
                                   "coordinate click")
-                        return click_with_timeout(coords)
+                        return click_with_timeout(coords, pag=pag)
                 except Exception as e:
                     logger.warning(f"Window connection failed with exception: {e}, "
                                  f"falling back to coordinate click")
@@ -225,7 +240,7 @@ def click_button_or_fallback(
             except Exception as e:
                 logger.warning(f"Button search failed: {e}, falling back to "
                              f"coordinate click")
-                return click_with_timeout(coords)
+                return click_with_timeout(coords, pag=pag)
 
             # Add timeout protection for button existence check
             try:
@@ -250,13 +265,13 @@ def click_button_or_fallback(
             except Exception as e:
                 logger.warning(f"Button existence check failed: {e}, falling "
                              f"back to coordinate click")
-                return click_with_timeout(coords)
+                return click_with_timeout(coords, pag=pag)
 
         except Exception as e:
             logger.warning(f"Button search/click failed: {e}")
 
         logger.info("Falling back to coordinate-based click")
-        return click_with_timeout(coords)
+        return click_with_timeout(coords, pag=pag)
 
     # Increase timeout for button operations that might hang
     result = run_with_timeout(button_operation, CLICK_TIMEOUT * 2)  # Double the timeout
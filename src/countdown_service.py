@@ -12,6 +12,7 @@ import logging
 import threading
 import time
 import tkinter
+from types import SimpleNamespace
 from typing import Any, Callable, Dict, Optional
 
 # Set up logger
@@ -73,11 +74,22 @@ class CountdownService:
     and user interaction during countdown periods.
     """
 
-    def __init__(self, ui_widgets: Dict[str, Any]):
+    def __init__(self, ui_widgets: Dict[str, Any], clock: Any = None):
         """
         SIMPLIFIED: Initialize the countdown service with minimal complexity.
+
+        Args:
+            ui_widgets: Widgets the countdown updates
+            clock: Time source providing time() and sleep(); tests pass a fake
+                clock so countdowns finish without real time passing. By
+                default sleeps block on an event that stop() sets, so the
+                countdown thread wakes at once instead of finishing its tick
         """
         self.ui_widgets = ui_widgets
+        self._stop_event = threading.Event()
+        self._clock = clock if clock is not None else SimpleNamespace(
+            time=time.time, sleep=self._stop_event.wait,
+        )
 
         # SIMPLIFIED: Single lock for all state
         self._lock = threading.Lock()
@@ -174,8 +186,9 @@ class CountdownService:
             self._cancelled = False
             self.on_countdown_complete = on_complete
 
-        # Clear completion event
+        # Clear completion and stop events
         self._completion_event.clear()
+        self._stop_event.clear()
 
         # Start countdown thread
         self._thread = threading.Thread(
@@ -201,6 +214,7 @@ class CountdownService:
             self._cancelled = True
             # Don't clear pause state when stopping - preserve it for transitions
 
+        self._stop_event.set()
         self._completion_event.set()
 
         if self._thread and self._thread.is_alive():
@@ -266,6 +280,7 @@ class CountdownService:
             self._active = False
             self._cancelled = False
             self._paused = False
+        self._stop_event.set()
         self._completion_event.set()
 
         if self._thread and self._thread.is_alive():
@@ -277,6 +292,7 @@ class CountdownService:
         logger.info("Completing countdown")
         with self._lock:
             self._active = False
+        self._stop_event.set()
         self._completion_event.set()
 
     def _get_final_state(self) -> Dict[str, Any]:
@@ -396,7 +412,7 @@ class CountdownService:
             # Initialize countdown
             total = max(0.0, float(seconds))
             remaining = total
-            start_time = time.time()
+            start_time = self._clock.time()
             pause_start_time = None  # Track when pause started
             total_pause_time = 0.0   # Track total time spent paused
 
@@ -415,20 +431,20 @@ class CountdownService:
                 if self.paused:
                     # Track pause start time
                     if pause_start_time is None:
-                        pause_start_time = time.time()
+                        pause_start_time = self._clock.time()
 
                     # Update display to show paused state
                     self._schedule_ui_update(remaining, total, text, next_text)
-                    time.sleep(WAIT_TICK)
+                    self._clock.sleep(WAIT_TICK)
                     continue
                 # Not paused - update total pause time if we were paused
                 if pause_start_time is not None:
-                    total_pause_time += time.time() - pause_start_time
+                    total_pause_time += self._clock.time() - pause_start_time
                     pause_start_time = None
 
                 # Check for timeout based on ACTUAL countdown time (excluding
                 # pause time)
-                actual_elapsed = time.time() - start_time - total_pause_time
+                actual_elapsed = self._clock.time() - start_time - total_pause_time
                 if actual_elapsed > total + 60:  # Allow 1 minute extra for safety
                     logger.error("Countdown timeout reached")
                     break
@@ -437,7 +453,7 @@ class CountdownService:
                 self._schedule_ui_update(remaining, total, text, next_text)
 
                 # Proper pause/resume logic - always wait full second
-                time.sleep(1.0)
+                self._clock.sleep(1.0)
                 remaining -= 1.0
 
             # Countdown completed
@@ -11,8 +11,12 @@ Author: Automation System
 Version: 3.0
 """
 
+import mmap
 import os
-from typing import List, Tuple, Union
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 try:
     from .config_service import ConfigService
@@ -32,6 +36,26 @@ except ImportError:
     from path_service import PathService
     from writer_service import WriterService
 
+# Prompt files are read in a few large chunks rather than the default 8 KiB
+READ_BUFFER = 1 << 16
+
+# Files at least this large are decoded straight from a memory map; below it
+# the extra mmap/munmap calls cost more than the read() copy they avoid
+MMAP_THRESHOLD = 1 << 17
+
+
+def _read_text(path: str) -> str:
+    """Read a UTF-8 file with newlines translated as text mode would."""
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            content = f.readall().decode("utf-8")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, "utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
 
 class PromptListService:
     """Orchestrator service for managing prompt list files with multiple
@@ -79,9 +103,15 @@ class PromptListService:
             # Get file extension
             file_ext = self.path_service.get_file_extension(resolved_path)
 
+            # CSV is parsed row by row straight from the file
+            if file_ext == "csv":
+                with open(
+                    resolved_path, encoding="utf-8", newline="", buffering=READ_BUFFER,
+                ) as f:
+                    return self.parser_service.parse_csv_lines(f)
+
             # Read file content
-            with open(resolved_path, encoding="utf-8") as f:
-                content = f.read().strip()
+            content = _read_text(resolved_path).strip()
 
             if not content:
                 return True, []
@@ -91,8 +121,6 @@ class PromptListService:
                 return self.parser_service.parse_python_file(resolved_path, content)
             if file_ext == "txt":
                 return self.parser_service.parse_text_file(content)
-            if file_ext == "csv":
-                return self.parser_service.parse_csv_file(content)
             # For unknown extensions, return error
             return False, "Unsupported file format"
 
@@ -101,6 +129,43 @@ class PromptListService:
         except Exception as e:
             return False, f"Unexpected error parsing file: {str(e)}"
 
+    def parse_many(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Tuple[bool, Union[List[str], str]]]:
+        """
+        Parse several prompt list files, spreading them over worker processes.
+
+        Parsing is CPU-bound (AST walks, regexes) and holds the GIL, so threads
+        would not help. A single file, a frozen (PyInstaller) build, where
+        worker processes would relaunch the app, or a pool that cannot start
+        falls back to parsing in this process.
+
+        Args:
+            paths: Paths to the prompt list files
+            max_workers: Worker process limit (default: CPU count)
+
+        Returns:
+            Dict mapping each path to its parse_prompt_list result, in input order
+        """
+        paths = list(paths)
+        if len(paths) < 2 or getattr(sys, "frozen", False):
+            return {path: self.parse_prompt_list(path) for path in paths}
+
+        workers = min(len(paths), max_workers or os.cpu_count() or 1)
+        # One chunk per worker keeps pickling round-trips to a minimum
+        chunksize = -(-len(paths) // workers)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _parse_prompt_list_worker, paths, chunksize=chunksize,
+                )
+                return dict(zip(paths, results))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Could not parse in worker processes: {e}")
+            return {path: self.parse_prompt_list(path) for path in paths}
+
     def get_prompt_preview(self, prompts: List[str], max_length: int = 100) -> str:
         """
         Get a preview of the first prompt for display.
@@ -186,3 +251,14 @@ class PromptListService:
         """Create directory for file if it doesn't exist (for backward
         compatibility)."""
         return self.path_service.create_directory_if_needed(file_path)
+
+
+_worker_service: Optional[PromptListService] = None
+
+
+def _parse_prompt_list_worker(path: str) -> Tuple[bool, Union[List[str], str]]:
+    """Process-pool entry point for parse_many; one service per worker process."""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = PromptListService()
+    return _worker_service.parse_prompt_list(path)
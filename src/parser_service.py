@@ -11,13 +11,198 @@ Version: 1.0
 """
 
 import ast
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
 import sys
-from typing import List, Optional, Tuple, Union
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Bump when _largest_string_list changes what it extracts, so entries written
+# by an older parser are ignored
+PARSER_VERSION = 1
+
+# Extracted prompt lists are cached on disk by source hash so unchanged files
+# skip ast.parse across runs; None disables the on-disk layer
+_AST_CACHE_DIR: Optional[Path] = Path.home() / ".prompt_stacker" / "ast-cache"
+_AST_CACHE_TAG = [PARSER_VERSION, *sys.version_info[:2]]
+# Oldest entries beyond this many are pruned whenever a new one is written
+_AST_CACHE_MAX_ENTRIES = 512
+
+# In-process layer over the disk cache: source hash -> prompts, oldest entry
+# evicted first once full
+_PARSED_PROMPTS: Dict[str, Tuple[str, ...]] = {}
+_PARSED_PROMPTS_MAX = 256
+
+# Fast path for the common file shape: an optional comment header and a single
+# `name = ["...", '...', ...]` assignment of plain string literals. Literals
+# with escapes, prefixes, implicit concatenation or triple quotes don't match
+# and go through ast.parse instead. Each header comment must end at a newline,
+# so a run of "#" can only match one way and a rejected file fails in linear time
+_PLAIN_STRING = r"""(?:"[^"\\\n]*"|'[^'\\\n]*')"""
+_SINGLE_LIST_RE = re.compile(
+    rf"\s*(?:#[^\n]*\n\s*)*[A-Za-z_]\w*\s*=\s*"
+    rf"(\[\s*(?:{_PLAIN_STRING}\s*,\s*)*(?:{_PLAIN_STRING}\s*)?\])\s*",
+)
+_PLAIN_STRING_RE = re.compile(r"\"([^\"\\\n]*)\"|'([^'\\\n]*)'")
+
+# A numbered prefix ("1.", "2)") followed by a bullet prefix ("-", "*", "•"),
+# each optional, so one match strips both the way two sequential subs did
+_PREFIX_RE = re.compile(r"(?:\d+[.)]\s*)?(?:[-*•]\s*)?")
+_BULLETS = ("-", "*", "•")
+
+# Section delimiters for text files, tried in order
+_TEXT_DELIMITERS = ("---", "===", "***", "###")
+
+
+def _load_cached_prompts(src_hash: str) -> Optional[Tuple[str, ...]]:
+    """Read a cached prompt list from disk, or None if missing or stale."""
+    if _AST_CACHE_DIR is None:
+        return None
+    try:
+        with open(_AST_CACHE_DIR / f"{src_hash}.json", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("tag") != _AST_CACHE_TAG:
+        return None
+    prompts = entry.get("prompts")
+    if not isinstance(prompts, list) or not all(isinstance(p, str) for p in prompts):
+        return None
+    return tuple(prompts)
+
+
+def _store_cached_prompts(src_hash: str, prompts: Tuple[str, ...]) -> None:
+    """Write a prompt list to the disk cache; failures only cost a re-parse."""
+    if _AST_CACHE_DIR is None:
+        return
+    try:
+        _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_AST_CACHE_DIR / f"{src_hash}.json", "w", encoding="utf-8") as f:
+            json.dump({"tag": _AST_CACHE_TAG, "prompts": list(prompts)}, f)
+    except OSError:
+        return
+    _prune_cached_prompts()
+
+
+def _prune_cached_prompts() -> None:
+    """Delete the oldest disk cache entries beyond _AST_CACHE_MAX_ENTRIES."""
+    try:
+        with os.scandir(_AST_CACHE_DIR) as it:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.endswith(".json")
+            ]
+    except OSError:
+        return
+    excess = len(entries) - _AST_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, path in entries[:excess]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _single_list_prompts(content: str) -> Optional[Tuple[str, ...]]:
+    """Prompts of a lone plain-literal list, or None if content isn't one."""
+    match = _SINGLE_LIST_RE.fullmatch(content)
+    if not match:
+        return None
+    # Only one list, so it is the largest; plain literals need no decoding
+    items = (
+        double or single for double, single in _PLAIN_STRING_RE.findall(match.group(1))
+    )
+    return tuple(item.strip() for item in items if item.strip())
+
+
+def _largest_string_list(content: str) -> Tuple[str, ...]:
+    """Stripped, non-empty items of the largest all-string list literal.
+
+    Returns an empty tuple if there is none; raises SyntaxError on bad input.
+    """
+    prompts = _single_list_prompts(content)
+    if prompts is not None:
+        return prompts
+    return _ast_string_list(content)
+
+
+def _ast_string_list(content: str) -> Tuple[str, ...]:
+    """_largest_string_list for content the fast path can't read."""
+    # ast.parse without its wrapper frame; dont_inherit keeps this module's
+    # __future__ flags out of the parse
+    tree = compile(content, "<unknown>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+
+    # Find all list literals in the code. This is ast.walk's breadth-first
+    # order, but the children of a list of constants are never queued; in a
+    # prompt file that is nearly every node. AST node classes and literal
+    # values are never subclassed, so exact type checks stand in for isinstance
+    list_literals = []
+    pending = deque([tree])
+
+    while pending:
+        node = pending.popleft()
+        if type(node) is ast.List:
+            # Read the constants' values in one comprehension; a list made only
+            # of constants has no nested lists, so its children are skipped.
+            # (Python 3.8+ parses every literal to ast.Constant, so there is
+            # no separate ast.Str case)
+            elts = node.elts
+            values = [item.value for item in elts if type(item) is ast.Constant]
+            if len(values) == len(elts):
+                # Keep it only if all items were strings
+                if values and all(type(value) is str for value in values):
+                    list_literals.append(values)
+                continue
+        pending.extend(ast.iter_child_nodes(node))
+
+    # Take the largest list (the first one found on ties)
+    if not list_literals:
+        return ()
+    largest = max(list_literals, key=len)
+    # Filter out empty strings
+    return tuple(item.strip() for item in largest if item.strip())
+
+
+def _parse_source_cached(content: str) -> Tuple[str, ...]:
+    """Extract the prompt list for content, reusing earlier results by hash.
+
+    The disk cache is only consulted when the AST walk would otherwise run;
+    for a lone plain list the fast path is cheaper than reading the entry.
+    """
+    src_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    prompts = _PARSED_PROMPTS.get(src_hash)
+    if prompts is not None:
+        return prompts
+
+    prompts = _single_list_prompts(content)
+    if prompts is None:
+        prompts = _load_cached_prompts(src_hash)
+        if prompts is None:
+            prompts = _ast_string_list(content)
+            _store_cached_prompts(src_hash, prompts)
+
+    if len(_PARSED_PROMPTS) >= _PARSED_PROMPTS_MAX:
+        del _PARSED_PROMPTS[next(iter(_PARSED_PROMPTS))]
+    _PARSED_PROMPTS[src_hash] = prompts
+    return prompts
 
 
 class ParserService:
     """Service for parsing different file formats into prompt lists."""
 
+    # Stateless: patterns and caches live at module level, so instances need
+    # no __dict__
+    __slots__ = ()
+
     def parse_python_file(
         self,
         file_path: str,
@@ -95,48 +280,13 @@ class ParserService:
         """
         Parse Python content using AST to find list literals.
         This is a fallback when import fails or no suitable variables found.
+        Results are cached by source hash, so unchanged content is not re-parsed.
         """
         try:
-            import ast
-
-            # Parse the Python code
-            tree = ast.parse(content)
-
-            # Find all list literals in the code
-            list_literals = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.List):
-                    # Check if this list contains string literals
-                    string_items = []
-                    for item in node.elts:
-                        if isinstance(item, ast.Constant) and isinstance(
-                            item.value,
-                            str,
-                        ):
-                            string_items.append(item.value)
-                        elif hasattr(
-                            item,
-                            "s",
-                        ):  # Handle ast.Str for older Python versions
-                            string_items.append(item.s)
-                        else:
-                            # Skip non-string items
-                            break
-                    else:
-                        # All items were strings
-                        if string_items:
-                            list_literals.append(string_items)
-
-            # Sort by length and return the largest list
-            if list_literals:
-                list_literals.sort(key=len, reverse=True)
-                largest_list = list_literals[0]
-                # Filter out empty strings
-                result = [item.strip() for item in largest_list if item.strip()]
-                if result:
-                    print(f"Found prompts using AST parsing ({len(result)} items)")
-                    return True, result
+            result = list(_parse_source_cached(content))
+            if result:
+                print(f"Found prompts using AST parsing ({len(result)} items)")
+                return True, result
 
             return False, "No valid prompt lists found in Python file"
 
@@ -157,50 +307,28 @@ class ParserService:
         5. Bullet format: "- prompt", "* prompt"
         """
         try:
-            if not content.strip():
+            # isspace() answers without copying the content the way strip() would
+            if not content or content.isspace():
                 return False, "No content found in text file"
 
             # Strategy 1: Try double-line separation first (for multi-line prompts)
             if "\n\n" in content:
-                sections = content.split("\n\n")
-                prompts = []
-                for section in sections:
-                    cleaned_section = section.strip()
-                    if cleaned_section:
-                        # Remove common prefixes
-                        cleaned_section = self._remove_common_prefixes(cleaned_section)
-                        if cleaned_section:
-                            prompts.append(cleaned_section)
+                prompts = self._clean_sections(content.split("\n\n"))
                 if prompts:
                     return True, prompts
-
-            # Strategy 2: Try custom delimiters (only if double-line separation
-            # didn't work)
-            if "\n\n" not in content:
-                delimiters = ["---", "===", "***", "###"]
-                for delimiter in delimiters:
+            else:
+                # Strategy 2: Try custom delimiters (only if there are no blank
+                # lines to separate on). Only the first delimiter present, in
+                # priority order, is split on; each check is a plain substring
+                # scan, which measured faster than one combined regex pass
+                for delimiter in _TEXT_DELIMITERS:
                     if delimiter in content:
-                        sections = content.split(delimiter)
-                        prompts = []
-                        for section in sections:
-                            cleaned_section = section.strip()
-                            if cleaned_section:
-                                cleaned_section = self._remove_common_prefixes(
-                                    cleaned_section,
-                                )
-                                if cleaned_section:
-                                    prompts.append(cleaned_section)
+                        prompts = self._clean_sections(content.split(delimiter))
                         if prompts:
                             return True, prompts
 
             # Strategy 3: Line-separated (default)
-            lines = []
-            for line in content.split("\n"):
-                cleaned_line = line.strip()
-                if cleaned_line:
-                    cleaned_line = self._remove_common_prefixes(cleaned_line)
-                    if cleaned_line:
-                        lines.append(cleaned_line)
+            lines = self._clean_sections(content.split("\n"))
 
             if lines:
                 return True, lines
@@ -210,84 +338,67 @@ class ParserService:
         except Exception as e:
             return False, f"Error parsing text file: {str(e)}"
 
+    def _clean_sections(self, sections: List[str]) -> List[str]:
+        """Strip prefixes and whitespace from sections, dropping empty ones."""
+        # _remove_common_prefixes strips on its own, so each section is
+        # stripped once rather than once to test it and again to clean it.
+        # The bound method is looked up once, not per section
+        remove_prefixes = self._remove_common_prefixes
+        return [
+            cleaned
+            for section in sections
+            if (cleaned := remove_prefixes(section))
+        ]
+
     def _remove_common_prefixes(self, text: str) -> str:
         """Remove common numbering and bullet prefixes from text."""
         text = text.strip()
-
-        # Remove numbered prefixes: "1.", "2.", "1)", "2)", etc.
-        import re
-
-        text = re.sub(r"^\d+[\.\)]\s*", "", text)
-
-        # Remove bullet prefixes: "- ", "* ", "• ", etc.
-        text = re.sub(r"^[\-\*•]\s*", "", text)
-
-        return text.strip()
+        # Most lines have no prefix; one startswith() over the bullet
+        # characters plus a digit check decides that without the regex
+        if text.startswith(_BULLETS) or text[:1].isdigit():
+            return text[_PREFIX_RE.match(text).end():].strip()
+        return text
 
     def parse_csv_file(self, content: str) -> Tuple[bool, Union[List[str], str]]:
         """Parse a CSV file as comma-separated prompts."""
+        if not content or content.isspace():
+            return False, "No valid prompts found in CSV file"
+        return self.parse_csv_lines(io.StringIO(content))
+
+    def parse_csv_lines(
+        self,
+        lines: Iterable[str],
+    ) -> Tuple[bool, Union[List[str], str]]:
+        """
+        Parse CSV prompts from an iterable of lines, such as an open file.
+
+        Rows are read one at a time with csv.reader, so a file is never held
+        in memory whole. Input with no non-blank lines parses as an empty list.
+        """
         try:
-            lines = content.strip().split("\n")
-            if not lines:
-                return False, "No valid prompts found in CSV file"
+            lines = iter(lines)
+            first = next((line for line in lines if line.strip()), None)
+            if first is None:
+                return True, []
+            second = next(lines, "")
 
             # Check if first line is header
-            if lines[0].strip().lower() in ["index,prompt", "prompt", "prompts"]:
-                lines = lines[1:]  # Skip header
-            elif "," in lines[0] and not lines[0].strip().startswith('"'):
+            if first.strip().lower() in ["index,prompt", "prompt", "prompts"]:
+                head = [second]  # Skip header
+            elif "," in first and not first.strip().startswith('"') and "," in second:
                 # If first line contains comma but doesn't start with quote,
-                # it might be a header
-                # Check if second line also contains comma (indicating data)
-                if len(lines) > 1 and "," in lines[1]:
-                    lines = lines[1:]  # Skip header
+                # and the second line also contains comma (indicating data),
+                # it is a header
+                head = [second]
+            else:
+                head = [first, second]
 
             prompts = []
-            for line in lines:
-                cleaned_line = line.strip()
-                if not cleaned_line:
-                    continue
-
-                # Handle CSV with index and prompt columns
-                if "," in line:
-                    # Split by comma
-                    parts = line.split(",", 1)  # Split only on first comma
-                    if len(parts) >= 2:
-                        # Has index and prompt columns
-                        prompt_part = parts[1].strip()
-
-                        # Handle quoted prompt
-                        if prompt_part.startswith('"'):
-                            # Find the closing quote, handling escaped quotes
-                            i = 1
-                            while i < len(prompt_part):
-                                if prompt_part[i] == '"':
-                                    if (
-                                        i + 1 < len(prompt_part)
-                                        and prompt_part[i + 1] == '"'
-                                    ):
-                                        # Escaped quote, skip next character
-                                        i += 2
-                                    else:
-                                        # End quote found
-                                        prompt = prompt_part[1:i]
-                                        # Handle escaped quotes
-                                        prompt = prompt.replace('""', '"')
-                                        break
-                                else:
-                                    i += 1
-                            else:
-                                # No closing quote found
-                                continue
-                        else:
-                            # Unquoted prompt
-                            prompt = prompt_part
-                    else:
-                        # Single column
-                        prompt = parts[0].strip()
-                else:
-                    # Single column without comma
-                    prompt = line.strip()
-
+            for row in csv.reader(itertools.chain(head, lines), skipinitialspace=True):
+                # Index and prompt columns, or a single prompt column; unquoted
+                # commas after the index belong to the prompt
+                prompt = ",".join(row[1:]) if len(row) > 1 else "".join(row)
+                prompt = prompt.strip()
                 if prompt:
                     prompts.append(prompt)
 
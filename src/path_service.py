@@ -12,10 +12,17 @@ Version: 1.0
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 
+@lru_cache(maxsize=512)
+def _file_extension(file_path: str) -> str:
+    """Lower-cased suffix of file_path without the dot (memoized; paths repeat)."""
+    return Path(file_path).suffix.lower().lstrip(".")
+
+
 class PathService:
     """Service for managing file paths and validation."""
 
@@ -108,7 +115,7 @@ class PathService:
         """
         if not file_path:
             return ""
-        return Path(file_path).suffix.lower().lstrip(".")
+        return _file_extension(file_path)
 
     def validate_file_path(self, file_path: str) -> bool:
         """
@@ -120,7 +127,9 @@ class PathService:
         Returns:
             True if valid, False otherwise
         """
-        return bool(file_path and isinstance(file_path, str))
+        # Purely syntactic: no filesystem access, and the type is checked
+        # first so non-string objects are never asked for their truth value
+        return isinstance(file_path, str) and file_path != ""
 
     def create_directory_if_needed(self, file_path: str) -> bool:
         """
@@ -6,11 +6,17 @@ and UI updates related to prompt management.
 """
 
 import logging
+import os
+import stat
+import string
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Characters that can surround or separate paths in the prompt path field
+_PATH_FILLER_CHARS = string.whitespace + ";"
+
 # Import with fallback for standalone execution
 try:
     from ..config import (
@@ -50,6 +56,9 @@ class PromptIO:
         self._prompts_modified = False
         self._current_file_path = ""
         self._original_prompts_hash = None
+        # (paths with their mtime and size, (prompts, file count)) of the
+        # last multiple-file load, reused while none of the files change
+        self._last_files_load = (None, None)
         # Prefer using the UI's file_service so external patches affect this loader
         if hasattr(ui, "file_service") and ui.file_service is not None:
             self.file_service = ui.file_service
@@ -135,7 +144,8 @@ class PromptIO:
                 valid_paths = []
                 for file_path in file_paths:
                     try:
-                        if Path(file_path).exists() and Path(file_path).is_file():
+                        # is_file() is False for missing paths, so one stat suffices
+                        if Path(file_path).is_file():
                             valid_paths.append(file_path)
                         else:
                             logger.warning(
@@ -401,6 +411,11 @@ class PromptIO:
                 logger.error("Invalid path input")
                 return False
 
+            # A cleared field or bare separators hold no paths; skip the split
+            if not path_input.strip(_PATH_FILLER_CHARS):
+                logger.error("No valid file paths found")
+                return False
+
             # Split paths by semicolon
             file_paths = [
                 path.strip() for path in path_input.split(";") if path.strip()
@@ -411,40 +426,31 @@ class PromptIO:
                 return False
 
             # BULLETPROOF IMPROVEMENT: Validate each file path
+            # One stat per path answers both "exists" and "is a regular file",
+            # and is kept for the reuse check in _read_prompt_files
             valid_paths = []
+            valid_stats = []
             for file_path in file_paths:
                 try:
-                    if Path(file_path).exists() and Path(file_path).is_file():
-                        valid_paths.append(file_path)
-                    else:
-                        logger.warning(
-                            f"File does not exist or is not a file: {file_path}",
-                        )
-                except Exception as e:
-                    logger.warning(f"Error validating file path {file_path}: {e}")
+                    st = os.stat(file_path)
+                except OSError:
+                    st = None
+                if st is not None and stat.S_ISREG(st.st_mode):
+                    valid_paths.append(file_path)
+                    valid_stats.append(st)
+                else:
+                    logger.warning(
+                        f"File does not exist or is not a file: {file_path}",
+                    )
 
             if not valid_paths:
                 logger.error("No valid files found")
                 return False
 
-            # Load prompts from each valid file
-            all_prompts = []
-            successful_files = 0
-
-            for file_path in valid_paths:
-                try:
-                    prompts = self._load_prompts_from_file(file_path)
-                    if prompts:
-                        all_prompts.extend(prompts)
-                        successful_files += 1
-                        logger.info(
-                            f"Successfully loaded {len(prompts)} prompts from "
-                            f"{file_path}",
-                        )
-                    else:
-                        logger.warning(f"No prompts loaded from {file_path}")
-                except Exception as e:
-                    logger.error(f"Error loading prompts from {file_path}: {e}")
+            all_prompts, successful_files = self._read_prompt_files(
+                valid_paths,
+                valid_stats,
+            )
 
             if successful_files == 0:
                 logger.error("Failed to load prompts from any files")
@@ -496,6 +502,53 @@ class PromptIO:
             logger.error(f"Error in _load_prompts_from_multiple_files: {e}")
             return False
 
+    def _read_prompt_files(
+        self,
+        file_paths: List[str],
+        file_stats: List[os.stat_result],
+    ) -> Tuple[List[str], int]:
+        """Read and concatenate prompts from each file, reusing the last result.
+
+        Args:
+            file_paths: Paths of existing prompt files, in load order
+            file_stats: os.stat results for file_paths, taken while validating
+
+        Returns:
+            Tuple of (all prompts, number of files that yielded prompts)
+        """
+        key = tuple(
+            (path, st.st_mtime_ns, st.st_size)
+            for path, st in zip(file_paths, file_stats)
+        )
+
+        cached_key, cached = self._last_files_load
+        if key == cached_key:
+            logger.debug("Prompt files unchanged since last load; reusing prompts")
+            return list(cached[0]), cached[1]
+
+        all_prompts = []
+        successful_files = 0
+
+        for file_path in file_paths:
+            try:
+                prompts = self._load_prompts_from_file(file_path)
+                if prompts:
+                    all_prompts.extend(prompts)
+                    successful_files += 1
+                    logger.info(
+                        f"Successfully loaded {len(prompts)} prompts from "
+                        f"{file_path}",
+                    )
+                else:
+                    logger.warning(f"No prompts loaded from {file_path}")
+            except Exception as e:
+                logger.error(f"Error loading prompts from {file_path}: {e}")
+
+        # Only a complete load is reused, so a file that failed is retried
+        if successful_files == len(file_paths):
+            self._last_files_load = (key, (list(all_prompts), successful_files))
+        return all_prompts, successful_files
+
     def _load_prompts_from_file(self, file_path: str) -> List[str]:
         """Load prompts from a single file and return the list."""
         try:
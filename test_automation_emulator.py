@@ -8,12 +8,18 @@ and allows for controlled testing of pause/resume, automation flow, and
 edge cases.
 """
 
+import contextlib
 import logging
+import queue
+import sys
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
 
 # Configure logging for testing
 logging.basicConfig(
@@ -22,6 +28,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default for event recording; disabled under ``python -O``. Scenarios that
+# analyze recorded data enable it explicitly via ``enable_recording``.
+RECORD_EVENTS = __debug__
+
+# Controller event names. Interned so analysis can compare by identity.
+EVT_AUTOMATION_STARTED = sys.intern("AUTOMATION_STARTED")
+EVT_AUTOMATION_STOPPED = sys.intern("AUTOMATION_STOPPED")
+EVT_PROMPT_ADVANCED = sys.intern("PROMPT_ADVANCED")
+EVT_NEW_CYCLE_STARTED = sys.intern("NEW_CYCLE_STARTED")
+EVT_NEW_CYCLE_SKIPPED = sys.intern("NEW_CYCLE_SKIPPED_PAUSED")
+EVT_PAUSE_TOGGLED = sys.intern("PAUSE_TOGGLED")
+EVT_AUTOMATION_THREAD_STARTED = sys.intern("AUTOMATION_THREAD_STARTED")
+EVT_AUTOMATION_THREAD_COMPLETED = sys.intern("AUTOMATION_THREAD_COMPLETED")
+EVT_AUTOMATION_THREAD_ERROR = sys.intern("AUTOMATION_THREAD_ERROR")
+EVT_PROMPT_AUTOMATION_STARTED = sys.intern("PROMPT_AUTOMATION_STARTED")
+EVT_PROMPT_AUTOMATION_COMPLETED = sys.intern("PROMPT_AUTOMATION_COMPLETED")
+EVT_PROMPT_AUTOMATION_ERROR = sys.intern("PROMPT_AUTOMATION_ERROR")
+
+# Status glyphs for boolean analysis values
+_GLYPHS = {False: "❌", True: "✅"}
+
 # =============================================================================
 # VIRTUAL COMPONENTS
 # =============================================================================
@@ -49,6 +76,34 @@ class VirtualTimers:
     cooldown: float = 1.0
     get_ready_delay: float = 2.0
 
+class _Event:
+    """Recorded controller or automation event."""
+    __slots__ = ("timestamp", "kind", "data")
+
+    def __init__(self, kind: str, data: Dict[str, Any]):
+        self.timestamp = time.time()
+        self.kind = kind
+        self.data = data
+
+class _DisplayUpdate:
+    """Recorded countdown display update."""
+    __slots__ = ("timestamp", "remaining", "total", "paused")
+
+    def __init__(self, remaining: float, total: float, paused: bool):
+        self.timestamp = time.time()
+        self.remaining = remaining
+        self.total = total
+        self.paused = paused
+
+class _StateChange:
+    """Recorded countdown state change."""
+    __slots__ = ("timestamp", "state", "remaining")
+
+    def __init__(self, state: str, remaining: float):
+        self.timestamp = time.time()
+        self.state = state
+        self.remaining = remaining
+
 class VirtualCountdownService:
     """Virtual countdown service for testing."""
 
@@ -56,14 +111,23 @@ class VirtualCountdownService:
         self._active = False
         self._paused = False
         self._cancelled = False
-        self._thread = None
+        self._worker = None
+        self._cmd_q = queue.SimpleQueue()
+        self._idle = threading.Event()
+        self._idle.set()
         self._lock = threading.Lock()
         self._completion_event = threading.Event()
         self._stop_event = threading.Event()
+        self._tick_event = threading.Event()
         self._current_remaining = 0.0
         self._current_total = 0.0
-        self._display_updates = []
-        self._state_changes = []
+        self._deadline = 0.0
+        self._pause_left = 0.0
+        # Recorded data only ever grows by appending; deques do that without
+        # the copy-on-grow reallocations of a list
+        self._display_updates: Deque[_DisplayUpdate] = deque()
+        self._state_changes: Deque[_StateChange] = deque()
+        self._recording = RECORD_EVENTS
 
     def start_countdown(self, seconds: float, text: str = None, next_text: str = None, last_text: str = None) -> Dict[str, Any]:
         """Start a virtual countdown."""
@@ -79,42 +143,65 @@ class VirtualCountdownService:
             self._cancelled = False
             self._current_total = seconds
             self._current_remaining = seconds
+            self._deadline = time.monotonic() + seconds
 
         # Clear events
         self._stop_event.clear()
         self._completion_event.clear()
 
-        # Start countdown thread
-        self._thread = threading.Thread(target=self._countdown_loop, daemon=True)
-        self._thread.start()
+        # Hand the countdown to the long-lived worker thread
+        self._idle.clear()
+        self._ensure_worker()
+        self._cmd_q.put(("start",))
 
         # Don't wait for completion - let it run independently
         # The calling code should handle the result when needed
 
         return {"started": True}
 
+    def _ensure_worker(self):
+        """Start the worker thread on first use; it then serves every countdown."""
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def _worker_loop(self):
+        """Run queued countdowns one at a time until shutdown() queues None."""
+        while True:
+            command = self._cmd_q.get()
+            if command is None:
+                break
+            if command[0] == "start":
+                self._countdown_loop()
+            self._idle.set()
+
     def _countdown_loop(self):
-        """Virtual countdown loop."""
+        """Virtual countdown loop driven by a monotonic deadline."""
         try:
-            while (self._current_remaining > 0 and
-                   self._active and
+            while (self._active and
                    not self._cancelled and
                    not self._stop_event.is_set()):
 
                 # Handle pause state
                 if self._paused:
                     self._record_state_change("PAUSED", self._current_remaining)
-                    time.sleep(0.1)  # Virtual tick
+                    self._stop_event.wait(0.1)  # Virtual tick
+                    self._tick_event.set()
                     continue
 
-                # Update display
-                self._record_display_update(self._current_remaining, self._current_total)
+                with self._lock:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._current_remaining = 0.0
+                        break
+                    self._current_remaining = remaining
 
-                # Wait for next tick
-                time.sleep(1.0)
+                # Update display
+                self._record_display_update(remaining, self._current_total)
 
-                # Decrement remaining time ONLY when not paused
-                self._current_remaining -= 1.0
+                # Sleep until the next display interval (or until stopped)
+                self._stop_event.wait(min(1.0, remaining))
+                self._tick_event.set()
 
             # Countdown completed
             with self._lock:
@@ -122,10 +209,12 @@ class VirtualCountdownService:
 
             # Signal completion
             self._completion_event.set()
+            self._tick_event.set()
 
         except Exception as e:
             logger.error(f"Error in virtual countdown loop: {e}")
             self._completion_event.set()
+            self._tick_event.set()
 
     def toggle_pause(self):
         """Toggle pause state."""
@@ -135,6 +224,12 @@ class VirtualCountdownService:
 
         with self._lock:
             self._paused = not self._paused
+            if self._paused:
+                # Freeze the time left so it can be restored on resume
+                self._pause_left = max(0.0, self._deadline - time.monotonic())
+                self._current_remaining = self._pause_left
+            else:
+                self._deadline = time.monotonic() + self._pause_left
             state = "PAUSED" if self._paused else "RESUMED"
             self._record_state_change(state, self._current_remaining)
 
@@ -149,9 +244,16 @@ class VirtualCountdownService:
         self._stop_event.set()
         self._completion_event.set()
 
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
-            self._thread = None
+        # Wait for the worker to finish the current countdown (no thread join)
+        self._idle.wait(timeout=1.0)
+
+    def shutdown(self):
+        """Stop the countdown and end the worker thread."""
+        self.stop()
+        if self._worker is not None:
+            self._cmd_q.put(None)
+            self._worker.join(timeout=1.0)
+            self._worker = None
 
     def is_active(self) -> bool:
         """Check if countdown is active."""
@@ -174,6 +276,23 @@ class VirtualCountdownService:
             self._cancelled = False
             self._current_remaining = 0.0
             self._current_total = 0.0
+            self._deadline = 0.0
+            self._pause_left = 0.0
+
+    def wait_for_ticks(self, count: int = 1, timeout: float = 2.0) -> bool:
+        """Wait for the countdown loop to complete ``count`` more ticks.
+
+        Returns False if a tick did not arrive within ``timeout`` seconds.
+        """
+        for _ in range(count):
+            self._tick_event.clear()
+            if not self._tick_event.wait(timeout):
+                return False
+        return True
+
+    def enable_recording(self, enabled: bool = True):
+        """Enable or disable recording of display updates and state changes."""
+        self._recording = enabled
 
     def _get_final_state(self) -> Dict[str, Any]:
         """Get final state."""
@@ -185,20 +304,15 @@ class VirtualCountdownService:
 
     def _record_display_update(self, remaining: float, total: float):
         """Record display update for testing."""
-        self._display_updates.append({
-            "timestamp": time.time(),
-            "remaining": remaining,
-            "total": total,
-            "paused": self._paused,
-        })
+        if not self._recording:
+            return
+        self._display_updates.append(_DisplayUpdate(remaining, total, self._paused))
 
     def _record_state_change(self, state: str, remaining: float):
         """Record state change for testing."""
-        self._state_changes.append({
-            "timestamp": time.time(),
-            "state": state,
-            "remaining": remaining,
-        })
+        if not self._recording:
+            return
+        self._state_changes.append(_StateChange(state, remaining))
 
     def get_test_data(self) -> Dict[str, Any]:
         """Get test data for analysis."""
@@ -219,29 +333,35 @@ class VirtualUI:
         self.current_prompt_index = 0
         self.countdown_service = VirtualCountdownService()
         self.automation_state = AutomationState.IDLE
-        self.automation_events = []
+        self.automation_events: Deque[_Event] = deque()
         self._automation_lock = threading.Lock()
+        self._recording = RECORD_EVENTS
+
+        # Coordinates and timers are fixed after construction, so build the
+        # read-only views handed out by get_coords/get_timers once
+        self._coords_cache = MappingProxyType({
+            "input": coordinates.input,
+            "submit": coordinates.submit,
+            "accept": coordinates.accept,
+        })
+        self._timers_cache = (
+            timers.start_delay,
+            timers.main_wait,
+            timers.cooldown,
+            timers.get_ready_delay,
+        )
 
     def get_prompts_safe(self) -> List[str]:
         """Get prompts safely."""
         return self.prompts.copy()
 
-    def get_coords(self) -> Dict[str, Tuple[int, int]]:
-        """Get coordinates."""
-        return {
-            "input": self.coordinates.input,
-            "submit": self.coordinates.submit,
-            "accept": self.coordinates.accept,
-        }
+    def get_coords(self) -> Mapping[str, Tuple[int, int]]:
+        """Get coordinates (read-only)."""
+        return self._coords_cache
 
     def get_timers(self) -> Tuple[float, float, float, float]:
         """Get timers."""
-        return (
-            self.timers.start_delay,
-            self.timers.main_wait,
-            self.timers.cooldown,
-            self.timers.get_ready_delay,
-        )
+        return self._timers_cache
 
     def countdown(self, seconds: float, text: str = None, next_text: str = None, last_text: str = None) -> Dict[str, Any]:
         """Start countdown."""
@@ -255,11 +375,9 @@ class VirtualUI:
 
     def _record_automation_event(self, event_type: str, data: Dict[str, Any]):
         """Record automation event for testing."""
-        self.automation_events.append({
-            "timestamp": time.time(),
-            "event": event_type,
-            "data": data,
-        })
+        if not self._recording:
+            return
+        self.automation_events.append(_Event(event_type, data))
 
 class VirtualSessionController:
     """Virtual session controller for testing."""
@@ -267,9 +385,15 @@ class VirtualSessionController:
     def __init__(self, ui: VirtualUI):
         self.ui = ui
         self._started = False
-        self._automation_lock = threading.Lock()
+        # Controller methods are only called from the thread driving the
+        # scenario, so the lock just guards that contract in debug runs and
+        # is dropped entirely under ``python -O``
+        self._automation_lock = threading.Lock() if __debug__ else contextlib.nullcontext()
         self._prompts_locked = False
-        self.controller_events = []
+        self._prereq_ok: Optional[bool] = None
+        self._last_idx = -1  # Last valid prompt index, fixed while prompts are locked
+        self.controller_events: Deque[_Event] = deque()
+        self._recording = RECORD_EVENTS
 
     def start_automation(self) -> bool:
         """Start automation."""
@@ -286,8 +410,9 @@ class VirtualSessionController:
                 return False
 
             self._prompts_locked = True
+            self._last_idx = len(self.ui.prompts) - 1
             self._started = True
-            self._record_controller_event("AUTOMATION_STARTED")
+            self._record_controller_event(EVT_AUTOMATION_STARTED)
 
             # Start automation thread
             self._start_automation_thread()
@@ -297,8 +422,9 @@ class VirtualSessionController:
         """Stop automation."""
         with self._automation_lock:
             self._reset_automation_state()
+            self._prereq_ok = None
             self._stop_countdown_if_active()
-            self._record_controller_event("AUTOMATION_STOPPED")
+            self._record_controller_event(EVT_AUTOMATION_STOPPED)
 
     def next_prompt(self):
         """Advance to next prompt."""
@@ -307,58 +433,61 @@ class VirtualSessionController:
                 # Just advance UI position
                 if self.ui.current_prompt_index < len(self.ui.prompts) - 1:
                     self.ui.current_prompt_index += 1
-                    self._record_controller_event("PROMPT_ADVANCED", {"index": self.ui.current_prompt_index})
+                    self._record_controller_event(EVT_PROMPT_ADVANCED, {"index": self.ui.current_prompt_index})
                 return
 
             # If automation is running, advance and potentially start new cycle
-            if self.ui.current_prompt_index < len(self.ui.prompts) - 1:
+            if self.ui.current_prompt_index < self._last_idx:
                 self._stop_countdown_if_active()
 
                 self.ui.current_prompt_index += 1
-                self._record_controller_event("PROMPT_ADVANCED", {"index": self.ui.current_prompt_index})
+                self._record_controller_event(EVT_PROMPT_ADVANCED, {"index": self.ui.current_prompt_index})
 
                 # CRITICAL FIX: Only start automation cycle if NOT paused
                 if not self.ui.countdown_service.is_paused():
                     self._start_prompt_automation()
-                    self._record_controller_event("NEW_CYCLE_STARTED")
+                    self._record_controller_event(EVT_NEW_CYCLE_STARTED)
                 else:
-                    self._record_controller_event("NEW_CYCLE_SKIPPED_PAUSED")
+                    self._record_controller_event(EVT_NEW_CYCLE_SKIPPED)
 
     def toggle_pause(self):
         """Toggle pause."""
         if self.ui.countdown_service.is_active():
             self.ui.countdown_service.toggle_pause()
-            self._record_controller_event("PAUSE_TOGGLED", {"paused": self.ui.countdown_service.is_paused()})
+            self._record_controller_event(EVT_PAUSE_TOGGLED, {"paused": self.ui.countdown_service.is_paused()})
 
     def is_started(self) -> bool:
         """Check if started."""
         return self._started
 
+    def enable_recording(self, enabled: bool = True):
+        """Enable or disable recording of controller events."""
+        self._recording = enabled
+
     def _validate_start_prerequisites(self) -> bool:
-        """Validate prerequisites."""
-        coords = self.ui.get_coords()
-        if not all(key in coords for key in ["input", "submit", "accept"]):
-            return False
+        """Validate prerequisites (cached until automation is stopped)."""
+        if self._prereq_ok:
+            return True
 
+        coords = self.ui.get_coords()
         timers = self.ui.get_timers()
-        if any(timer <= 0 for timer in timers):
-            return False
-
-        if len(self.ui.prompts) == 0:
-            return False
-
-        return True
+        self._prereq_ok = (
+            all(key in coords for key in ["input", "submit", "accept"])
+            and not any(timer <= 0 for timer in timers)
+            and len(self.ui.prompts) > 0
+        )
+        return self._prereq_ok
 
     def _start_automation_thread(self):
         """Start automation thread."""
         def automation_worker():
             try:
-                self._record_controller_event("AUTOMATION_THREAD_STARTED")
+                self._record_controller_event(EVT_AUTOMATION_THREAD_STARTED)
                 # Simulate automation process
                 time.sleep(0.1)  # Brief delay to simulate processing
-                self._record_controller_event("AUTOMATION_THREAD_COMPLETED")
+                self._record_controller_event(EVT_AUTOMATION_THREAD_COMPLETED)
             except Exception as e:
-                self._record_controller_event("AUTOMATION_THREAD_ERROR", {"error": str(e)})
+                self._record_controller_event(EVT_AUTOMATION_THREAD_ERROR, {"error": str(e)})
 
         thread = threading.Thread(target=automation_worker, daemon=True)
         thread.start()
@@ -367,12 +496,12 @@ class VirtualSessionController:
         """Start prompt automation."""
         def prompt_worker():
             try:
-                self._record_controller_event("PROMPT_AUTOMATION_STARTED")
+                self._record_controller_event(EVT_PROMPT_AUTOMATION_STARTED)
                 # Simulate single prompt automation
                 time.sleep(0.1)
-                self._record_controller_event("PROMPT_AUTOMATION_COMPLETED")
+                self._record_controller_event(EVT_PROMPT_AUTOMATION_COMPLETED)
             except Exception as e:
-                self._record_controller_event("PROMPT_AUTOMATION_ERROR", {"error": str(e)})
+                self._record_controller_event(EVT_PROMPT_AUTOMATION_ERROR, {"error": str(e)})
 
         thread = threading.Thread(target=prompt_worker, daemon=True)
         thread.start()
@@ -390,16 +519,25 @@ class VirtualSessionController:
 
     def _record_controller_event(self, event_type: str, data: Dict[str, Any] = None):
         """Record controller event."""
-        self.controller_events.append({
-            "timestamp": time.time(),
-            "event": event_type,
-            "data": data or {},
-        })
+        if not self._recording:
+            return
+        self.controller_events.append(_Event(event_type, data or {}))
 
 # =============================================================================
 # TEST SCENARIOS
 # =============================================================================
 
+def _count_new_cycles(events: Deque[_Event]) -> Tuple[int, int]:
+    """Count started and pause-skipped cycles in a single pass."""
+    started = skipped = 0
+    for event in events:
+        kind = event.kind
+        if kind is EVT_NEW_CYCLE_STARTED:
+            started += 1
+        elif kind is EVT_NEW_CYCLE_SKIPPED:
+            skipped += 1
+    return started, skipped
+
 class AutomationTestScenario:
     """Base class for automation test scenarios."""
 
@@ -434,6 +572,10 @@ class PauseResumeTest(AutomationTestScenario):
         ui = VirtualUI(prompts, coordinates, timers)
         controller = VirtualSessionController(ui)
 
+        # Analysis reads the recorded data, so record even under -O
+        ui.countdown_service.enable_recording(True)
+        controller.enable_recording(True)
+
         return ui, controller
 
     def run(self) -> Dict[str, Any]:
@@ -446,24 +588,22 @@ class PauseResumeTest(AutomationTestScenario):
 
         # Start a countdown
         result = ui.countdown(5.0, "Test countdown")
-        time.sleep(1.0)
+        ui.countdown_service.wait_for_ticks(1)
 
         # Pause the countdown
         controller.toggle_pause()
-        time.sleep(2.0)
+        ui.countdown_service.wait_for_ticks(2)
 
         # Resume the countdown
         controller.toggle_pause()
-        time.sleep(2.0)
+        ui.countdown_service.wait_for_ticks(2)
 
-        # Click Next while paused
+        # Click Next while paused (this stops the countdown, so no more ticks)
         controller.toggle_pause()  # Pause again
         controller.next_prompt()
-        time.sleep(1.0)
 
         # Resume and continue
         controller.toggle_pause()
-        time.sleep(2.0)
 
         # Stop automation
         controller.stop_automation()
@@ -471,10 +611,13 @@ class PauseResumeTest(AutomationTestScenario):
         # Wait a bit for any final processing
         time.sleep(0.5)
 
+        countdown_data = ui.countdown_service.get_test_data()
+        ui.countdown_service.shutdown()
+
         return {
             "ui": ui,
             "controller": controller,
-            "countdown_data": ui.countdown_service.get_test_data(),
+            "countdown_data": countdown_data,
         }
 
     def analyze(self) -> Dict[str, Any]:
@@ -489,23 +632,22 @@ class PauseResumeTest(AutomationTestScenario):
         state_changes = countdown_data["state_changes"]
 
         # Check if time was preserved during pause
-        paused_updates = [u for u in display_updates if u["paused"]]
-        non_paused_updates = [u for u in display_updates if not u["paused"]]
+        paused_updates = [u for u in display_updates if u.paused]
+        non_paused_updates = [u for u in display_updates if not u.paused]
 
         # Check if new cycles were started when paused
-        controller_events = controller.controller_events
-        new_cycle_events = [e for e in controller_events if "NEW_CYCLE" in e["event"]]
+        cycles_started, cycles_skipped = _count_new_cycles(controller.controller_events)
 
         # Check if pause actually worked by looking at state changes
-        pause_states = [s for s in state_changes if s["state"] == "PAUSED"]
-        resume_states = [s for s in state_changes if s["state"] == "RESUMED"]
+        pause_states = [s for s in state_changes if s.state == "PAUSED"]
+        resume_states = [s for s in state_changes if s.state == "RESUMED"]
 
         analysis = {
             "pause_worked": len(pause_states) > 0,
             "time_preserved": countdown_data["final_remaining"] > 0,  # Time was preserved if not 0
-            "new_cycles_when_paused": any("SKIPPED_PAUSED" in e["event"] for e in new_cycle_events),
-            "total_cycles_started": len([e for e in new_cycle_events if "STARTED" in e["event"]]),
-            "state_changes": [e["state"] for e in state_changes],
+            "new_cycles_when_paused": cycles_skipped > 0,
+            "total_cycles_started": cycles_started,
+            "state_changes": [e.state for e in state_changes],
             "final_remaining": countdown_data["final_remaining"],
             "pause_count": len(pause_states),
             "resume_count": len(resume_states),
@@ -528,6 +670,10 @@ class NextButtonPauseTest(AutomationTestScenario):
         ui = VirtualUI(prompts, coordinates, timers)
         controller = VirtualSessionController(ui)
 
+        # Analysis reads the recorded data, so record even under -O
+        ui.countdown_service.enable_recording(True)
+        controller.enable_recording(True)
+
         return ui, controller
 
     def run(self) -> Dict[str, Any]:
@@ -540,18 +686,16 @@ class NextButtonPauseTest(AutomationTestScenario):
 
         # Start countdown and pause it
         ui.countdown(10.0, "Long countdown")
-        time.sleep(1.0)
+        ui.countdown_service.wait_for_ticks(1)
         controller.toggle_pause()  # Pause
-        time.sleep(0.5)
+        ui.countdown_service.wait_for_ticks(1)
 
         # Click Next multiple times while paused
         for i in range(3):
             controller.next_prompt()
-            time.sleep(0.2)
 
         # Resume and let it complete
         controller.toggle_pause()  # Resume
-        time.sleep(2.0)
 
         # Stop automation
         controller.stop_automation()
@@ -559,6 +703,8 @@ class NextButtonPauseTest(AutomationTestScenario):
         # Wait a bit for any final processing
         time.sleep(0.5)
 
+        ui.countdown_service.shutdown()
+
         return {
             "ui": ui,
             "controller": controller,
@@ -569,13 +715,8 @@ class NextButtonPauseTest(AutomationTestScenario):
         results = self.run()
         controller = results["controller"]
 
-        # Analyze controller events
-        events = controller.controller_events
-        new_cycle_events = [e for e in events if "NEW_CYCLE" in e["event"]]
-
         # Count how many cycles were started vs skipped
-        cycles_started = len([e for e in new_cycle_events if "STARTED" in e["event"]])
-        cycles_skipped = len([e for e in new_cycle_events if "SKIPPED_PAUSED" in e["event"]])
+        cycles_started, cycles_skipped = _count_new_cycles(controller.controller_events)
 
         analysis = {
             "total_next_clicks": 3,
@@ -608,22 +749,34 @@ class AutomationTestRunner:
         print("🧪 RUNNING AUTOMATION TEST SUITE")
         print("=" * 50)
 
+        # Scenarios are independent and spend their time sleeping, so run
+        # them concurrently and report in registration order afterwards
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(self.scenarios))) as executor:
+            futures = {executor.submit(scenario.analyze): scenario for scenario in self.scenarios}
+            for future in as_completed(futures):
+                scenario = futures[future]
+                try:
+                    outcomes[scenario.name] = future.result()
+                except Exception as e:
+                    outcomes[scenario.name] = e
+
         all_results = {}
 
         for scenario in self.scenarios:
             print(f"\n🔍 Running: {scenario.name}")
             print("-" * 30)
 
-            try:
-                analysis = scenario.analyze()
-                all_results[scenario.name] = analysis
+            outcome = outcomes[scenario.name]
+            if isinstance(outcome, Exception):
+                print(f"❌ Test failed: {outcome}")
+                all_results[scenario.name] = {"error": str(outcome)}
+                continue
 
-                # Print results
-                self._print_analysis(scenario.name, analysis)
+            all_results[scenario.name] = outcome
 
-            except Exception as e:
-                print(f"❌ Test failed: {e}")
-                all_results[scenario.name] = {"error": str(e)}
+            # Print results
+            self._print_analysis(scenario.name, outcome)
 
         print("\n" + "=" * 50)
         print("📊 TEST SUMMARY")
@@ -639,13 +792,13 @@ class AutomationTestRunner:
             print(f"❌ {test_name}: FAILED - {analysis['error']}")
             return
 
-        print(f"📋 {test_name} Results:")
+        lines = [f"📋 {test_name} Results:"]
         for key, value in analysis.items():
             if isinstance(value, bool):
-                status = "✅" if value else "❌"
-                print(f"   {status} {key}: {value}")
+                lines.append(f"   {_GLYPHS[value]} {key}: {value}")
             else:
-                print(f"   📊 {key}: {value}")
+                lines.append(f"   📊 {key}: {value}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _print_summary(self, results: Dict[str, Any]):
         """Print test summary."""
@@ -669,10 +822,12 @@ class AutomationTestRunner:
             else:
                 passed_tests += 1
 
-        print(f"📈 Total Tests: {total_tests}")
-        print(f"✅ Passed: {passed_tests}")
-        print(f"❌ Failed: {failed_tests}")
-        print(f"📊 Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        sys.stdout.write("\n".join([
+            f"📈 Total Tests: {total_tests}",
+            f"✅ Passed: {passed_tests}",
+            f"❌ Failed: {failed_tests}",
+            f"📊 Success Rate: {(passed_tests/total_tests)*100:.1f}%",
+        ]) + "\n")
 
 # =============================================================================
 # MAIN TEST EXECUTION
@@ -4,9 +4,3 @@ Test suite for Cursor Automation System
 This package contains unit tests, integration tests, and test utilities
 for the automation system components.
 """
-
-import os
-import sys
-
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -5,16 +5,13 @@ This module provides shared fixtures, test utilities, and configuration
 for all tests in the automation system.
 """
 
-import os
 import sys
 import tempfile
+from types import MappingProxyType
 from unittest.mock import Mock
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 
 @pytest.fixture
 def temp_dir():
@@ -23,6 +20,22 @@ def temp_dir():
         yield temp_dir
 
 
+@pytest.fixture(scope="session")
+def _ast_cache_dir(tmp_path_factory):
+    """Session-wide directory standing in for the parser's on-disk AST cache."""
+    return tmp_path_factory.mktemp("ast-cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ast_cache(_ast_cache_dir, monkeypatch):
+    """Keep the parser's AST cache out of the real home directory."""
+    # src/ is on the path too, so the module may be loaded under either name
+    for name in ("parser_service", "src.parser_service"):
+        module = sys.modules.get(name)
+        if module is not None:
+            monkeypatch.setattr(module, "_AST_CACHE_DIR", _ast_cache_dir)
+
+
 @pytest.fixture
 def sample_prompts():
     """Sample prompts for testing."""
@@ -35,14 +48,14 @@ def sample_prompts():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_coordinates():
-    """Sample coordinates for testing."""
-    return {
+    """Sample coordinates for testing (read-only; use dict() to get a mutable copy)."""
+    return MappingProxyType({
         "input": (100, 200),
         "submit": (300, 400),
         "accept": (500, 600),
-    }
+    })
 
 
 @pytest.fixture
@@ -213,3 +226,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "automation: mark test as automation-related",
     )
+    config.addinivalue_line(
+        "markers", "paste_class: paste/next test class run by run_paste_next_tests.py",
+    )
+    config.addinivalue_line(
+        "markers", "paste_smoke: critical paste/next test in the quick smoke run",
+    )
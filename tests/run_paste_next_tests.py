@@ -12,61 +12,143 @@ Usage:
     python tests/run_paste_next_tests.py
 """
 
-import subprocess
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
+# Paths are fixed for the lifetime of the script; resolve them (and stat the
+# test file) once instead of in every runner function
+_TESTS_DIR = Path(__file__).parent
+_PROJECT_ROOT = _TESTS_DIR.parent
+_TEST_FILE = _TESTS_DIR / "test_paste_and_next_operations.py"
+_TEST_FILE_EXISTS = _TEST_FILE.exists()
 
-def run_paste_next_tests():
-    """Run the dedicated paste and next button tests."""
 
-    # Get the tests directory
-    tests_dir = Path(__file__).parent
-    project_root = tests_dir.parent
+def _parallel_args():
+    """Fail-fast and pytest-xdist options for batch runs.
 
-    # Add project root to Python path
-    sys.path.insert(0, str(project_root))
+    ``-x`` would serialize xdist workers, so batch runs stop after a few
+    failures instead and spread tests across cores when xdist is installed.
+    """
+    args = ["--maxfail=3"]
+    if importlib.util.find_spec("xdist") is not None:
+        args.extend(["-n", "auto"])
+    return args
 
-    print("🧪 Running Paste Operations and Next Button Tests")
-    print("=" * 60)
-
-    # Test file to run
-    test_file = tests_dir / "test_paste_and_next_operations.py"
-
-    if not test_file.exists():
-        print(f"❌ Test file not found: {test_file}")
-        return False
-
-    # Run the tests with pytest
-    cmd = [
-        sys.executable, "-m", "pytest",
+def _paste_next_args(test_file):
+    """Pytest arguments for a full run of the paste/next test file."""
+    return [
         str(test_file),
         "-v",  # Verbose output
         "--tb=short",  # Short traceback format
         "--color=yes",  # Colored output
         "--durations=10",  # Show top 10 slowest tests
-        "-x",  # Stop on first failure
+        *_parallel_args(),
     ]
 
-    print(f"Running: {' '.join(cmd)}")
+def run_paste_next_tests():
+    """Run the dedicated paste and next button tests."""
+    import pytest
+
+    # Add project root to Python path (once, even if called repeatedly)
+    root = str(_PROJECT_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    print("🧪 Running Paste Operations and Next Button Tests")
+    print("=" * 60)
+
+    if not _TEST_FILE_EXISTS:
+        print(f"❌ Test file not found: {_TEST_FILE}")
+        return False
+
+    # Run the tests with pytest in this process
+    args = _paste_next_args(_TEST_FILE)
+
+    print(f"Running: pytest {' '.join(args)}")
     print()
 
     try:
-        result = subprocess.run(cmd, cwd=project_root, check=False)
-        return result.returncode == 0
+        return pytest.main(args) == 0
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return False
 
+def exec_paste_next_tests():
+    """Replace this process with pytest running the paste/next tests.
+
+    Used when the full run is the script's last action, so no parent process
+    is left waiting on a child. Only returns (False) if the test file is missing.
+    """
+    if not _TEST_FILE_EXISTS:
+        print(f"❌ Test file not found: {_TEST_FILE}")
+        return False
+
+    print("🧪 Running Paste Operations and Next Button Tests")
+    print("=" * 60)
+    sys.stdout.flush()
+
+    os.chdir(_PROJECT_ROOT)
+    os.execv(sys.executable, [sys.executable, "-m", "pytest", *_paste_next_args(_TEST_FILE)])
+    return False  # pragma: no cover - execv does not return
+
+class _OutcomeReporter:
+    """Pytest plugin that reports PASS/FAIL per target at session end.
+
+    Outcomes are bucketed by a key derived from each report's node id, so a
+    single pytest session can stand in for one run per class or test.
+    """
+
+    def __init__(self, key, targets):
+        self._key = key
+        self._targets = targets
+        self.seen = set()
+        self.failed = set()
+        self.all_passed = False
+
+    def pytest_runtest_logreport(self, report):
+        group = self._key(report.nodeid)
+        self.seen.add(group)
+        if report.failed:
+            self.failed.add(group)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        print()
+        all_passed = True
+        for target in self._targets:
+            if target not in self.seen:
+                print(f"❌ {target} - NOT RUN")
+                all_passed = False
+            elif target in self.failed:
+                print(f"❌ {target} - FAILED")
+                all_passed = False
+            else:
+                print(f"✅ {target} - PASSED")
+        self.all_passed = all_passed and exitstatus == 0
+
+def _run_in_process(marker, key, targets, extra_args):
+    """Run the tests carrying ``marker`` in one pytest session and report per target."""
+    import pytest
+
+    reporter = _OutcomeReporter(key, targets)
+    try:
+        pytest.main(
+            [str(_TEST_FILE), "-m", marker, "-v", "--tb=short", "--color=yes",
+             "-p", "no:cacheprovider", *extra_args],
+            plugins=[reporter],
+        )
+    except Exception as e:
+        print(f"❌ Error running tests: {e}")
+        return False
+
+    return reporter.all_passed
+
 def run_specific_test_classes():
     """Run specific test classes for focused testing."""
 
-    tests_dir = Path(__file__).parent
-    project_root = tests_dir.parent
-    test_file = tests_dir / "test_paste_and_next_operations.py"
-
-    if not test_file.exists():
-        print(f"❌ Test file not found: {test_file}")
+    if not _TEST_FILE_EXISTS:
+        print(f"❌ Test file not found: {_TEST_FILE}")
         return False
 
     # Test classes to run
@@ -81,42 +163,20 @@ def run_specific_test_classes():
     print("🧪 Running Specific Test Classes")
     print("=" * 60)
 
-    all_passed = True
-
-    for test_class in test_classes:
-        print(f"\n📋 Running {test_class}...")
-
-        cmd = [
-            sys.executable, "-m", "pytest",
-            f"{test_file}::{test_class}",
-            "-v",
-            "--tb=short",
-            "--color=yes",
-            "-x",
-        ]
-
-        try:
-            result = subprocess.run(cmd, cwd=project_root, check=False)
-            if result.returncode == 0:
-                print(f"✅ {test_class} - PASSED")
-            else:
-                print(f"❌ {test_class} - FAILED")
-                all_passed = False
-        except Exception as e:
-            print(f"❌ {test_class} - ERROR: {e}")
-            all_passed = False
-
-    return all_passed
+    # Classes are selected by the paste_class marker; the list names the
+    # expected targets for the per-class report
+    return _run_in_process(
+        "paste_class",
+        key=lambda nodeid: nodeid.split("::")[1],
+        targets=test_classes,
+        extra_args=_parallel_args(),
+    )
 
 def run_quick_smoke_tests():
     """Run a quick smoke test of the most critical functionality."""
 
-    tests_dir = Path(__file__).parent
-    project_root = tests_dir.parent
-    test_file = tests_dir / "test_paste_and_next_operations.py"
-
-    if not test_file.exists():
-        print(f"❌ Test file not found: {test_file}")
+    if not _TEST_FILE_EXISTS:
+        print(f"❌ Test file not found: {_TEST_FILE}")
         return False
 
     print("🚀 Running Quick Smoke Tests")
@@ -129,36 +189,22 @@ def run_quick_smoke_tests():
         "TestCancelButtonFunctionality::test_cancel_automation_stops_controller",
     ]
 
-    all_passed = True
-
-    for test_name in smoke_tests:
-        print(f"\n🔍 Running {test_name}...")
-
-        cmd = [
-            sys.executable, "-m", "pytest",
-            f"{test_file}::{test_name}",
-            "-v",
-            "--tb=short",
-            "--color=yes",
-            "-x",
-        ]
-
-        try:
-            result = subprocess.run(cmd, cwd=project_root, check=False)
-            if result.returncode == 0:
-                print(f"✅ {test_name} - PASSED")
-            else:
-                print(f"❌ {test_name} - FAILED")
-                all_passed = False
-        except Exception as e:
-            print(f"❌ {test_name} - ERROR: {e}")
-            all_passed = False
-
-    return all_passed
+    # Tests are selected by the paste_smoke marker
+    return _run_in_process(
+        "paste_smoke",
+        key=lambda nodeid: nodeid.split("::", 1)[1],
+        targets=smoke_tests,
+        extra_args=["-x"],  # Stopping early is the point of a smoke run
+    )
 
 def main():
     """Main function to run tests based on command line arguments."""
 
+    # A full run is the last thing this script does; on POSIX hand the
+    # process over to pytest instead of waiting on it (Windows execv spawns
+    # a detached child and loses the exit code, so run in-process there)
+    run_all = exec_paste_next_tests if os.name == "posix" else run_paste_next_tests
+
     if len(sys.argv) > 1:
         test_type = sys.argv[1].lower()
 
@@ -167,7 +213,7 @@ def main():
         elif test_type == "classes":
             success = run_specific_test_classes()
         elif test_type == "all":
-            success = run_paste_next_tests()
+            success = run_all()
         else:
             print("Usage: python run_paste_next_tests.py [smoke|classes|all]")
             print("  smoke   - Run quick smoke tests")
@@ -176,7 +222,7 @@ def main():
             return False
     else:
         # Default: run all tests
-        success = run_paste_next_tests()
+        success = run_all()
 
     print("\n" + "=" * 60)
     if success:
@@ -5,69 +5,98 @@ Test Runner for Cursor Automation System
 This script runs the complete test suite with proper configuration and reporting.
 """
 
-import argparse
+import importlib.util
+import os
 import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+
+# The flag set is small and fixed, so it is parsed by hand instead of with
+# argparse: this script is run once per test file in some CI loops, where
+# importing and building an ArgumentParser is a measurable share of startup.
+# The tradeoff is that --help is a hardcoded string and has to be kept in
+# sync with the tables below when a flag is added.
+USAGE = """usage: run_tests.py [options]
+
+Run tests for Cursor Automation System
+
+options:
+  -h, --help            show this help message and exit
+  --unit                Run only unit tests
+  --integration         Run only integration tests
+  --slow                Include slow tests
+  --ui                  Include UI tests
+  --automation          Include automation tests
+  --coverage            Generate coverage report
+  -v, --verbose         Verbose output
+  --test-file FILE      Run specific test file
+  --test-function NAME  Run specific test function
+  --jobs JOBS           Number of pytest-xdist workers (default: auto, 0 disables xdist)
+  --lf                  Run only the tests that failed last time
+  --ff                  Run last failures first, then the rest (default)
+  --no-cache            Disable pytest's cache (implies no --lf/--ff ordering)"""
+
+_BOOL_FLAGS = {
+    "--unit": "unit",
+    "--integration": "integration",
+    "--slow": "slow",
+    "--ui": "ui",
+    "--automation": "automation",
+    "--coverage": "coverage",
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--lf": "lf",
+    "--ff": "ff",
+    "--no-cache": "no_cache",
+}
+
+_VALUE_FLAGS = {
+    "--test-file": "test_file",
+    "--test-function": "test_function",
+    "--jobs": "jobs",
+}
+
+
+def parse_args(argv):
+    """Parse command line flags into a namespace; exits on --help or bad input."""
+    args = SimpleNamespace(test_file=None, test_function=None, jobs="auto")
+    for attr in _BOOL_FLAGS.values():
+        setattr(args, attr, False)
+
+    tokens = iter(argv)
+    for token in tokens:
+        flag, sep, value = token.partition("=")
+        if token in ("-h", "--help"):
+            print(USAGE)
+            sys.exit(0)
+        elif token in _BOOL_FLAGS:
+            setattr(args, _BOOL_FLAGS[token], True)
+        elif flag in _VALUE_FLAGS:
+            if not sep:
+                value = next(tokens, None)
+                if value is None:
+                    print(f"{USAGE}\nrun_tests.py: error: {flag} expects a value", file=sys.stderr)
+                    sys.exit(2)
+            setattr(args, _VALUE_FLAGS[flag], value)
+        else:
+            print(f"{USAGE}\nrun_tests.py: error: unrecognized argument: {token}", file=sys.stderr)
+            sys.exit(2)
+    return args
 
 
 def main():
     """Main test runner function."""
-    parser = argparse.ArgumentParser(description="Run tests for Cursor Automation System")
-    parser.add_argument(
-        "--unit",
-        action="store_true",
-        help="Run only unit tests",
-    )
-    parser.add_argument(
-        "--integration",
-        action="store_true",
-        help="Run only integration tests",
-    )
-    parser.add_argument(
-        "--slow",
-        action="store_true",
-        help="Include slow tests",
-    )
-    parser.add_argument(
-        "--ui",
-        action="store_true",
-        help="Include UI tests",
-    )
-    parser.add_argument(
-        "--automation",
-        action="store_true",
-        help="Include automation tests",
-    )
-    parser.add_argument(
-        "--coverage",
-        action="store_true",
-        help="Generate coverage report",
-    )
-    parser.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Verbose output",
-    )
-    parser.add_argument(
-        "--test-file",
-        type=str,
-        help="Run specific test file",
-    )
-    parser.add_argument(
-        "--test-function",
-        type=str,
-        help="Run specific test function",
-    )
-
-    args = parser.parse_args()
-
-    # Add src to Python path
-    src_path = Path(__file__).parent / "src"
-    sys.path.insert(0, str(src_path))
+    args = parse_args(sys.argv[1:])
+
+    # Add src to Python path (once, even if main() is called repeatedly)
+    src_path = str(Path(__file__).parent.parent / "src")
+    if src_path not in sys.path:
+        sys.path.insert(0, src_path)
 
     # Build pytest command
-    cmd = ["python", "-m", "pytest"]
+    cmd = [sys.executable, "-m", "pytest"]
 
     # Add test selection
     if args.unit:
@@ -107,6 +136,22 @@ def main():
     else:
         cmd.append("tests/")
 
+    # Run in parallel with pytest-xdist; --dist=loadfile keeps each test
+    # file on a single worker so module-level fixtures are shared
+    if str(args.jobs) != "0":
+        if importlib.util.find_spec("xdist") is not None:
+            cmd.extend(["-n", str(args.jobs), "--dist=loadfile"])
+        else:
+            print("pytest-xdist not installed; running tests serially")
+
+    # Reuse pytest's .pytest_cache so previous failures are run first
+    if args.no_cache:
+        cmd.extend(["-p", "no:cacheprovider"])
+    elif args.lf:
+        cmd.append("--last-failed")
+    else:
+        cmd.append("--failed-first")
+
     # Add pytest options
     cmd.extend([
         "--tb=short",
@@ -117,6 +162,13 @@ def main():
     print(f"Running tests with command: {' '.join(cmd)}")
     print("=" * 60)
 
+    # Running pytest is the last thing this script does; on POSIX replace
+    # the process rather than keeping an idle parent around. Windows execv
+    # spawns a detached child and loses the exit code, so use a subprocess.
+    if os.name == "posix":
+        sys.stdout.flush()
+        os.execv(sys.executable, cmd)
+
     try:
         result = subprocess.run(cmd, check=False)
         return result.returncode
@@ -8,18 +8,14 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-# Import with fallback for relative import issues
-try:
-    from src.automator import run_automation
-except ImportError:
-    # Fallback for when running tests directly
-    import os
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-    from automator import run_automation
+from src.automator import click_button_or_fallback, paste_text_safely, run_automation
 
 # Import test utilities
-from .test_utils import AutomationTestMixin, create_mock_ui_session
+from .test_utils import AutomationTestMixin, create_stub_ui_session
+
+
+def _no_sleep(_seconds):
+    """Stand-in for time.sleep passed to the automator helpers."""
 
 
 class TestAutomator(AutomationTestMixin):
@@ -27,45 +23,32 @@ class TestAutomator(AutomationTestMixin):
 
     @pytest.fixture
     def mock_ui(self):
-        """Create a mock UI for testing with AutomationController compatibility."""
-        return create_mock_ui_session()
+        """Create a stub UI for testing with AutomationController compatibility."""
+        return create_stub_ui_session()
 
-    @pytest.fixture
+    # The mocks below are built once per module rather than once per test;
+    # _reset_mocks restores their default configuration between tests.
+    # pyautogui and pyperclip are passed to the helpers explicitly instead of
+    # being patched into src.automator, so they never touch module globals.
+
+    @pytest.fixture(scope="module")
     def mock_pyautogui(self):
         """Mock pyautogui for testing."""
-        with patch("src.automator.pyautogui") as mock_pag:
-            mock_pag.click.return_value = None
-            mock_pag.write.return_value = None
-            mock_pag.hotkey.return_value = None
-            mock_pag.position.return_value = (100, 200)
-            yield mock_pag
+        return Mock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_pyperclip(self):
         """Mock pyperclip for testing."""
-        with patch("src.automator.pyperclip") as mock_clip:
-            mock_clip.copy.return_value = None
-            # Make paste return the same text that was copied
-            def paste_side_effect():
-                return mock_clip.copy.call_args[0][0] if mock_clip.copy.call_args else "test text"
-            mock_clip.paste.side_effect = paste_side_effect
-            yield mock_clip
+        return Mock()
 
-    @pytest.fixture
-    def mock_time(self):
-        """Mock time module for testing."""
-        with patch("src.automator.time") as mock_time:
-            mock_time.sleep.return_value = None
-            yield mock_time
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_dpi(self):
         """Mock DPI awareness for testing."""
         with patch("src.automator.enable_windows_dpi_awareness") as mock_dpi:
             mock_dpi.return_value = None
             yield mock_dpi
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_cursor_window(self):
         """Mock CursorWindow for testing."""
         with patch("src.automator.CursorWindow") as mock_win:
@@ -73,69 +56,81 @@ class TestAutomator(AutomationTestMixin):
             mock_win.return_value = mock_win_instance
             yield mock_win_instance
 
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_pyautogui, mock_pyperclip, mock_dpi, mock_cursor_window):
+        """Reset the shared mocks to their default configuration."""
+        for mock in (mock_pyautogui, mock_pyperclip, mock_dpi, mock_cursor_window):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        mock_pyautogui.click.return_value = None
+        mock_pyautogui.write.return_value = None
+        mock_pyautogui.hotkey.return_value = None
+        mock_pyautogui.position.return_value = (100, 200)
+
+        # Make paste return the same text that was copied; a single slot is
+        # all a clipboard holds, so there is no history to grow or index into
+        last = ["test text"]
+
+        def _copy(text):
+            last[0] = text
+
+        mock_pyperclip.copy.side_effect = _copy
+        mock_pyperclip.paste.side_effect = lambda: last[0]
+
+        mock_dpi.return_value = None
+        yield
+
     @pytest.mark.unit
-    def test_paste_text_safely_success(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_success(self, mock_pyperclip):
         """Test successful text pasting."""
-        from src.automator import paste_text_safely
-
-        result = paste_text_safely("test text")
+        result = paste_text_safely("test text", clip=mock_pyperclip, sleep=_no_sleep)
 
         assert result is True
         mock_pyperclip.copy.assert_called_once_with("test text")
         mock_pyperclip.paste.assert_called_once()
 
     @pytest.mark.unit
-    def test_paste_text_safely_failure(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_failure(self, mock_pyperclip):
         """Test text pasting failure."""
-        from src.automator import paste_text_safely
-
         # Mock paste to return different text (override the side_effect)
         mock_pyperclip.paste.side_effect = lambda: "different text"
 
-        result = paste_text_safely("test text")
+        result = paste_text_safely("test text", clip=mock_pyperclip, sleep=_no_sleep)
 
         assert result is False
 
     @pytest.mark.unit
-    def test_paste_text_safely_empty_text(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_empty_text(self, mock_pyperclip):
         """Test pasting empty text."""
-        from src.automator import paste_text_safely
-
-        result = paste_text_safely("")
+        result = paste_text_safely("", clip=mock_pyperclip, sleep=_no_sleep)
 
         assert result is False
         mock_pyperclip.copy.assert_not_called()
 
     @pytest.mark.unit
-    def test_paste_text_safely_none_text(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_none_text(self, mock_pyperclip):
         """Test pasting None text."""
-        from src.automator import paste_text_safely
-
-        result = paste_text_safely(None)
+        result = paste_text_safely(None, clip=mock_pyperclip, sleep=_no_sleep)
 
         assert result is False
         mock_pyperclip.copy.assert_not_called()
 
     @pytest.mark.unit
-    def test_click_button_or_fallback_success(self, mock_pyautogui, mock_time):
+    def test_click_button_or_fallback_success(self, mock_pyautogui):
         """Test successful button clicking."""
-        from src.automator import click_button_or_fallback
-
         # Create a mock CursorWindow
         mock_win = Mock()
         mock_win.window = None
         mock_win.connect.return_value = False
 
-        result = click_button_or_fallback(mock_win, (100, 200), "fallback_key")
+        result = click_button_or_fallback(mock_win, (100, 200), "fallback_key", pag=mock_pyautogui)
 
         assert result is True
         mock_pyautogui.click.assert_called_once_with(100, 200)
 
     @pytest.mark.unit
-    def test_click_button_or_fallback_with_fallback(self, mock_pyautogui, mock_time):
+    def test_click_button_or_fallback_with_fallback(self, mock_pyautogui):
         """Test button clicking with fallback."""
-        from src.automator import click_button_or_fallback
-
         # Create a mock CursorWindow
         mock_win = Mock()
         mock_win.window = None
@@ -144,7 +139,7 @@ class TestAutomator(AutomationTestMixin):
         # Mock click to fail (return None)
         mock_pyautogui.click.return_value = None
 
-        result = click_button_or_fallback(mock_win, (100, 200), "ctrl+enter")
+        result = click_button_or_fallback(mock_win, (100, 200), "ctrl+enter", pag=mock_pyautogui)
 
         assert result is True
         mock_pyautogui.click.assert_called_once_with(100, 200)
@@ -172,55 +167,37 @@ class TestAutomator(AutomationTestMixin):
         assert isinstance(prompts, list)
         assert len(prompts) > 0
 
-    @pytest.mark.unit
-    def test_run_automation_main_function(self):
-        """Test the main run_automation function."""
+    @pytest.fixture
+    def session_ui(self):
+        """Patch the SessionUI used by run_automation and yield its instance."""
         with patch("src.automator.SessionUI") as mock_ui_class:
             mock_ui = Mock()
             mock_ui_class.return_value = mock_ui
-            mock_ui.wait_for_start.return_value = True
-            mock_ui._started = True
-
-            with patch("src.automation_controller.AutomationController") as mock_controller_class:
-                mock_controller = Mock()
-                mock_controller.start_automation.return_value = True
-                mock_controller_class.return_value = mock_controller
-
-                result = run_automation([])
-
-                assert result is True
-                mock_controller.start_automation.assert_called_once()
+            yield mock_ui
 
     @pytest.mark.unit
-    def test_run_automation_main_function_no_start(self):
-        """Test the main run_automation function when start is cancelled."""
-        with patch("src.automator.SessionUI") as mock_ui_class:
-            mock_ui = Mock()
-            mock_ui_class.return_value = mock_ui
-            mock_ui.wait_for_start.return_value = False
-            mock_ui._started = False
+    @pytest.mark.parametrize("prompts", [[], ["Prompt 1", "Prompt 2"]], ids=["no_prompts", "with_prompts"])
+    def test_run_automation_main_function(self, session_ui, prompts):
+        """Test the main run_automation function, with and without provided prompts."""
+        session_ui.wait_for_start.return_value = True
+        session_ui._started = True
 
-            result = run_automation([])
+        with patch("src.automation_controller.AutomationController") as mock_controller_class:
+            mock_controller = Mock()
+            mock_controller.start_automation.return_value = True
+            mock_controller_class.return_value = mock_controller
 
-            assert result is False
+            result = run_automation(prompts)
 
-    @pytest.mark.unit
-    def test_run_automation_main_function_with_prompts(self):
-        """Test the main run_automation function with provided prompts."""
-        test_prompts = ["Prompt 1", "Prompt 2"]
+            assert result is True
+            mock_controller.start_automation.assert_called_once()
 
-        with patch("src.automator.SessionUI") as mock_ui_class:
-            mock_ui = Mock()
-            mock_ui_class.return_value = mock_ui
-            mock_ui.wait_for_start.return_value = True
-            mock_ui._started = True
-
-            with patch("src.automation_controller.AutomationController") as mock_controller_class:
-                mock_controller = Mock()
-                mock_controller.start_automation.return_value = True
-                mock_controller_class.return_value = mock_controller
+    @pytest.mark.unit
+    def test_run_automation_main_function_no_start(self, session_ui):
+        """Test the main run_automation function when start is cancelled."""
+        session_ui.wait_for_start.return_value = False
+        session_ui._started = False
 
-                result = run_automation(test_prompts)
+        result = run_automation([])
 
-                assert result is True
-                mock_controller.start_automation.assert_called_once()
+        assert result is False
@@ -8,17 +8,29 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+import coordinate_service as cs
 from coordinate_service import CoordinateCaptureService
 
 
+@pytest.fixture(scope="module")
+def _shared_service():
+    """Construct one service instance for the whole module."""
+    with patch.object(cs, "load_coords", return_value={}):
+        return CoordinateCaptureService()
+
+
 class TestCoordinateCaptureService:
     """Test cases for CoordinateCaptureService."""
 
     @pytest.fixture
-    def service(self):
-        """Create a fresh service instance for each test."""
-        with patch("coordinate_service.load_coords", return_value={}):
-            return CoordinateCaptureService()
+    def service(self, _shared_service):
+        """Reset the shared service to its freshly constructed state for each test."""
+        _shared_service.coords = {}
+        _shared_service.capture_active = False
+        _shared_service.capture_key = None
+        _shared_service.listener = None
+        _shared_service.on_coord_captured = None
+        return _shared_service
 
     @pytest.mark.unit
     def test_init(self, service):
@@ -32,20 +44,22 @@ class TestCoordinateCaptureService:
     @pytest.mark.unit
     def test_get_coordinates(self, service, sample_coordinates):
         """Test getting coordinates."""
-        service.coords = sample_coordinates.copy()
+        service.coords = dict(sample_coordinates)
         coords = service.get_coordinates()
 
         assert coords == sample_coordinates
         assert coords is not service.coords  # Should be a copy
 
     @pytest.mark.unit
-    def test_set_coordinate(self, service):
+    def test_set_coordinate(self, service, monkeypatch):
         """Test setting a coordinate."""
-        with patch("coordinate_service.save_coords") as mock_save:
-            service.set_coordinate("input", (100, 200))
+        saved = []
+        monkeypatch.setattr(cs, "save_coords", saved.append)
+
+        service.set_coordinate("input", (100, 200))
 
-            assert service.coords["input"] == (100, 200)
-            mock_save.assert_called_once_with(service.coords)
+        assert service.coords["input"] == (100, 200)
+        assert saved == [service.coords]
 
     @pytest.mark.unit
     def test_has_coordinate_true(self, service):
@@ -73,26 +87,30 @@ class TestCoordinateCaptureService:
         assert coord is None
 
     @pytest.mark.unit
-    def test_clear_coordinate(self, service):
+    def test_clear_coordinate(self, service, monkeypatch):
         """Test clearing a specific coordinate."""
-        with patch("coordinate_service.save_coords") as mock_save:
-            service.coords = {"input": (100, 200), "submit": (300, 400)}
-            service.clear_coordinate("input")
+        saved = []
+        monkeypatch.setattr(cs, "save_coords", saved.append)
 
-            assert "input" not in service.coords
-            assert "submit" in service.coords
-            mock_save.assert_called_once()
+        service.coords = {"input": (100, 200), "submit": (300, 400)}
+        service.clear_coordinate("input")
+
+        assert "input" not in service.coords
+        assert "submit" in service.coords
+        assert len(saved) == 1
 
     @pytest.mark.unit
-    def test_remove_coordinate(self, service):
+    def test_remove_coordinate(self, service, monkeypatch):
         """Test removing a coordinate."""
-        with patch("coordinate_service.save_coords") as mock_save:
-            service.coords["input"] = (100, 200)
-            result = service.remove_coordinate("input")
+        saved = []
+        monkeypatch.setattr(cs, "save_coords", saved.append)
 
-            assert result is True
-            assert "input" not in service.coords
-            mock_save.assert_called_once()
+        service.coords["input"] = (100, 200)
+        result = service.remove_coordinate("input")
+
+        assert result is True
+        assert "input" not in service.coords
+        assert len(saved) == 1
 
     @pytest.mark.unit
     def test_remove_coordinate_not_exists(self, service):
@@ -103,7 +121,7 @@ class TestCoordinateCaptureService:
     @pytest.mark.unit
     def test_start_capture_success(self, service):
         """Test successful capture start."""
-        with patch("coordinate_service.mouse.Listener") as mock_listener_class:
+        with patch.object(cs.mouse, "Listener") as mock_listener_class:
             mock_listener = Mock()
             mock_listener_class.return_value = mock_listener
 
@@ -184,7 +202,7 @@ class TestCoordinateCaptureService:
     @pytest.mark.unit
     def test_on_click_success(self, service):
         """Test successful click handling."""
-        with patch("coordinate_service.mouse.Button") as mock_button:
+        with patch.object(cs.mouse, "Button") as mock_button:
             mock_button.left = "left"
             service.capture_active = True
             service.capture_key = "input"
@@ -214,7 +232,7 @@ class TestCoordinateCaptureService:
     @pytest.mark.unit
     def test_on_click_wrong_button(self, service):
         """Test click handling with wrong button."""
-        with patch("coordinate_service.mouse.Button") as mock_button:
+        with patch.object(cs.mouse, "Button") as mock_button:
             mock_button.left = "left"
             service.capture_active = True
             with patch.object(service, "stop_capture") as mock_stop:
@@ -224,7 +242,7 @@ class TestCoordinateCaptureService:
     @pytest.mark.unit
     def test_on_click_callback_error(self, service):
         """Test click handling with callback error."""
-        with patch("coordinate_service.mouse.Button") as mock_button:
+        with patch.object(cs.mouse, "Button") as mock_button:
             mock_button.left = "left"
             service.capture_active = True
             service.capture_key = "input"
@@ -256,101 +274,82 @@ class TestCoordinateCaptureService:
         assert label == "Invalid"
 
     @pytest.mark.unit
-    def test_validate_coordinates_success(self, service, sample_coordinates):
-        """Test successful coordinate validation."""
-        service.coords = sample_coordinates.copy()
-        result = service.validate_coordinates()
-
-        assert result["input"] is True
-        assert result["submit"] is True
-        assert result["accept"] is True
-
-    @pytest.mark.unit
-    def test_validate_coordinates_missing(self, service):
-        """Test coordinate validation with missing coordinates."""
-        service.coords = {"input": (100, 200)}  # Missing submit and accept
-
-        result = service.validate_coordinates()
-
-        assert result["input"] is True
-        assert result["submit"] is False
-        assert result["accept"] is False
-
-    @pytest.mark.unit
-    def test_validate_coordinates_invalid(self, service):
-        """Test coordinate validation with invalid coordinates."""
-        service.coords = {
-            "input": (-1, 200),  # Invalid x coordinate
-            "submit": (300, -1),  # Invalid y coordinate
-            "accept": (500, 600),
-        }
-
-        result = service.validate_coordinates()
+    @pytest.mark.parametrize(
+        ("coords", "expected"),
+        [
+            (
+                {"input": (100, 200), "submit": (300, 400), "accept": (500, 600)},
+                {"input": True, "submit": True, "accept": True},
+            ),
+            (
+                {"input": (100, 200)},  # Missing submit and accept
+                {"input": True, "submit": False, "accept": False},
+            ),
+            (
+                {"input": (-1, 200), "submit": (300, -1), "accept": (500, 600)},
+                {"input": False, "submit": False, "accept": True},
+            ),
+        ],
+        ids=["success", "missing", "invalid"],
+    )
+    def test_validate_coordinates(self, service, coords, expected):
+        """Test validation of all target coordinates."""
+        service.coords = dict(coords)
+        assert service.validate_coordinates() == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ((100, 200), True),
+            ((-1, 200), False),  # Invalid x coordinate
+            ((100, -1), False),  # Invalid y coordinate
+            ("not a tuple", False),  # Invalid type
+            ((100, 200, 300), False),  # Wrong tuple length
+        ],
+        ids=["success", "invalid_x", "invalid_y", "invalid_type", "wrong_length"],
+    )
+    def test_validate_coordinate(self, service, value, expected):
+        """Test single coordinate validation."""
+        service.coords["input"] = value
+        assert service.validate_coordinate("input") is expected
+
+    @pytest.mark.unit
+    def test_save_coordinates_success(self, service, monkeypatch):
+        """Test successful coordinate saving."""
+        saved = []
+        monkeypatch.setattr(cs, "save_coords", saved.append)
 
-        assert result["input"] is False  # Invalid coordinate
-        assert result["submit"] is False  # Invalid coordinate
-        assert result["accept"] is True   # Valid coordinate
+        service.coords = {"input": (100, 200)}
+        service.save_coordinates()
+        assert saved == [{"input": (100, 200)}]
 
     @pytest.mark.unit
-    def test_validate_coordinate_success(self, service):
-        """Test successful single coordinate validation."""
-        service.coords["input"] = (100, 200)
-        result = service.validate_coordinate("input")
-        assert result is True
+    def test_save_coordinates_error(self, service, monkeypatch):
+        """Test coordinate saving with error."""
+        def save_coords(coords):
+            raise Exception("Save error")
 
-    @pytest.mark.unit
-    def test_validate_coordinate_invalid_x(self, service):
-        """Test coordinate validation with invalid x coordinate."""
-        service.coords["input"] = (-1, 200)
-        result = service.validate_coordinate("input")
-        assert result is False
+        monkeypatch.setattr(cs, "save_coords", save_coords)
 
-    @pytest.mark.unit
-    def test_validate_coordinate_invalid_y(self, service):
-        """Test coordinate validation with invalid y coordinate."""
-        service.coords["input"] = (100, -1)
-        result = service.validate_coordinate("input")
-        assert result is False
+        service.coords = {"input": (100, 200)}
+        service.save_coordinates()  # Should not raise error
 
     @pytest.mark.unit
-    def test_validate_coordinate_invalid_type(self, service):
-        """Test coordinate validation with invalid type."""
-        service.coords["input"] = "not a tuple"
-        result = service.validate_coordinate("input")
-        assert result is False
+    def test_load_coordinates_success(self, service, monkeypatch):
+        """Test successful coordinate loading."""
+        monkeypatch.setattr(cs, "load_coords", lambda: {"input": (100, 200)})
 
-    @pytest.mark.unit
-    def test_validate_coordinate_wrong_length(self, service):
-        """Test coordinate validation with wrong tuple length."""
-        service.coords["input"] = (100, 200, 300)
-        result = service.validate_coordinate("input")
-        assert result is False
+        service._load_coordinates()
+        assert service.coords == {"input": (100, 200)}
 
     @pytest.mark.unit
-    def test_save_coordinates_success(self, service):
-        """Test successful coordinate saving."""
-        with patch("coordinate_service.save_coords") as mock_save:
-            service.coords = {"input": (100, 200)}
-            service.save_coordinates()
-            mock_save.assert_called_once_with({"input": (100, 200)})
+    def test_load_coordinates_error(self, service, monkeypatch):
+        """Test coordinate loading with error."""
+        def load_coords():
+            raise Exception("Load error")
 
-    @pytest.mark.unit
-    def test_save_coordinates_error(self, service):
-        """Test coordinate saving with error."""
-        with patch("coordinate_service.save_coords", side_effect=Exception("Save error")):
-            service.coords = {"input": (100, 200)}
-            service.save_coordinates()  # Should not raise error
+        monkeypatch.setattr(cs, "load_coords", load_coords)
 
-    @pytest.mark.unit
-    def test_load_coordinates_success(self, service):
-        """Test successful coordinate loading."""
-        with patch("coordinate_service.load_coords", return_value={"input": (100, 200)}):
-            service._load_coordinates()
-            assert service.coords == {"input": (100, 200)}
-
-    @pytest.mark.unit
-    def test_load_coordinates_error(self, service):
-        """Test coordinate loading with error."""
-        with patch("coordinate_service.load_coords", side_effect=Exception("Load error")):
-            service._load_coordinates()
-            assert service.coords == {}
+        service._load_coordinates()
+        assert service.coords == {}
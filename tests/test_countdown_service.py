@@ -4,27 +4,71 @@ Unit tests for CountdownService.
 Tests the countdown functionality for the automation system.
 """
 
-from unittest.mock import Mock, patch
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
 from countdown_service import CountdownService
 
 
+class FakeTime:
+    """Clock whose sleep() advances time() instantly instead of blocking."""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def time(self):
+        return self.t
+
+    def sleep(self, seconds):
+        self.t += seconds
+
+    perf_counter = time
+
+
+_WIDGET_NAMES = ("time_label", "progress", "pause_btn", "current_box", "next_box")
+
+
+def _inert_widget():
+    """Widget stand-in that accepts the calls the service makes and ignores them."""
+    return SimpleNamespace(
+        configure=lambda **kwargs: None,
+        set=lambda value: None,
+        delete=lambda *args: None,
+        insert=lambda *args: None,
+    )
+
+
+@pytest.fixture(scope="module")
+def _shared_service():
+    """CountdownService on inert widgets and a FakeTime clock, built once."""
+    widgets = {name: _inert_widget() for name in _WIDGET_NAMES}
+    return CountdownService(widgets, clock=FakeTime())
+
+
 class TestCountdownService:
     """Test cases for CountdownService."""
 
     @pytest.fixture
-    def service(self):
-        """Create a fresh service instance for each test."""
-        mock_widgets = {
-            "time_label": Mock(),
-            "progress": Mock(),
-            "pause_btn": Mock(),
-            "current_box": Mock(),
-            "next_box": Mock(),
-        }
-        return CountdownService(mock_widgets)
+    def service(self, _shared_service):
+        """Shared service with its countdown state, clock and callbacks cleared.
+
+        The clock is rewound to zero, both callbacks are unset and the widgets
+        the tests touch are swapped for fresh inert ones.
+        """
+        _shared_service.force_reset()
+        _shared_service._clock.t = 0.0
+        _shared_service.on_countdown_complete = None
+        _shared_service.on_pause_state_changed = None
+
+        # Tests may replace, clear or instrument widgets; give each test fresh
+        # inert ones (tests that assert on a widget swap in a Mock themselves)
+        for name in ("time_label", "pause_btn", "current_box", "next_box"):
+            setattr(_shared_service, name, _inert_widget())
+        return _shared_service
 
     @pytest.mark.unit
     def test_init(self, service):
@@ -36,68 +80,35 @@ class TestCountdownService:
         assert service.on_countdown_complete is None
 
     @pytest.mark.unit
-    def test_start_countdown_success(self, service):
-        """Test successful countdown start."""
+    @pytest.mark.parametrize(
+        "seconds", [5, 0, -5, 0.2], ids=["success", "zero", "negative", "cooldown"],
+    )
+    def test_start_countdown_values(self, service, seconds):
+        """Test countdown start with normal, zero, negative and cooldown durations."""
         callback = Mock()
 
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(5, "Current text", "Next text", "Last text", callback)
+        result = service.start_countdown(seconds, "Current text", "Next text", "Last text", callback)
 
         assert service.countdown_active is False  # Countdown completes immediately in test
         assert result["cancelled"] is False
 
-    @pytest.mark.unit
-    def test_start_countdown_zero_seconds(self, service):
-        """Test countdown with zero seconds."""
-        callback = Mock()
-
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(0.1, "Current text", "Next text", "Last text", callback)
-
-        assert service.countdown_active is False  # Countdown completes immediately
-        assert result["cancelled"] is False
-
-    @pytest.mark.unit
-    def test_start_countdown_negative_seconds(self, service):
-        """Test countdown with negative seconds."""
-        callback = Mock()
-
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(0.1, "Current text", "Next text", "Last text", callback)
-
-        assert service.countdown_active is False  # Countdown completes immediately
-        assert result["cancelled"] is False
-
     @pytest.mark.unit
     def test_start_countdown_with_callback(self, service):
         """Test countdown with callback function."""
         callback = Mock()
 
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(1, "Current text", "Next text", "Last text", callback)
+        result = service.start_countdown(1, "Current text", "Next text", "Last text", callback)
 
         callback.assert_called_once()
 
     @pytest.mark.unit
     def test_start_countdown_without_callback(self, service):
         """Test countdown without callback function."""
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(1, "Current text", "Next text", "Last text", None)
+        result = service.start_countdown(1, "Current text", "Next text", "Last text", None)
 
         # Should not raise error
         assert result is not None
 
-    @pytest.mark.unit
-    def test_start_countdown_cooldown_value(self, service):
-        """Test countdown with realistic cooldown value (0.2 seconds)."""
-        callback = Mock()
-
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            result = service.start_countdown(0.2, "Current text", "Next text", "Last text", callback)
-
-        assert service.countdown_active is False  # Countdown completes immediately
-        assert result["cancelled"] is False
-
     @pytest.mark.unit
     def test_toggle_pause(self, service):
         """Test pausing countdown."""
@@ -190,10 +201,18 @@ class TestCountdownService:
         service._update_display(5.0, 10.0, "Current", "Next")
 
     @pytest.mark.unit
-    def test_countdown_loop_normal_completion(self, service):
-        """Test normal countdown loop completion."""
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            service._countdown_loop(5.0, "Current", "Next", "Last")
+    @pytest.mark.parametrize(
+        ("duration", "current", "next_", "last"),
+        [
+            (5.0, "Current", "Next", "Last"),
+            (0.1, "Current", "Next", "Last"),
+            (1.0, None, None, None),
+        ],
+        ids=["normal_completion", "very_short_duration", "none_texts"],
+    )
+    def test_countdown_loop_completes(self, service, duration, current, next_, last):
+        """Test countdown loop completion for normal, very short and empty inputs."""
+        service._countdown_loop(duration, current, next_, last)
 
         assert service.countdown_active is False
 
@@ -202,8 +221,7 @@ class TestCountdownService:
         """Test countdown loop when cancelled."""
         service.cancelled = True
 
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            service._countdown_loop(5.0, "Current", "Next", "Last")
+        service._countdown_loop(5.0, "Current", "Next", "Last")
 
         assert service.countdown_active is False
 
@@ -212,24 +230,7 @@ class TestCountdownService:
         """Test countdown loop with pause/resume."""
         service.paused = True
 
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            service._countdown_loop(1.0, "Current", "Next", "Last")
-
-        assert service.countdown_active is False
-
-    @pytest.mark.unit
-    def test_countdown_loop_very_short_duration(self, service):
-        """Test countdown loop with very short duration."""
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            service._countdown_loop(0.1, "Current", "Next", "Last")
-
-        assert service.countdown_active is False
-
-    @pytest.mark.unit
-    def test_countdown_loop_with_none_texts(self, service):
-        """Test countdown loop with None texts."""
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            service._countdown_loop(1.0, None, None, None)
+        service._countdown_loop(1.0, "Current", "Next", "Last")
 
         assert service.countdown_active is False
 
@@ -239,12 +240,44 @@ class TestCountdownService:
         callback = Mock(side_effect=Exception("Callback error"))
         service.on_countdown_complete = callback
 
-        with patch("countdown_service.time.sleep") as mock_sleep:
-            # Should not raise error, should still complete
-            service._countdown_loop(1.0, "Current", "Next", "Last")
+        # Should not raise error, should still complete
+        service._countdown_loop(1.0, "Current", "Next", "Last")
 
         assert service.countdown_active is False
 
+    @pytest.mark.unit
+    def test_stop_wakes_countdown_thread_immediately(self):
+        """Test that stop() interrupts the countdown's tick wait instead of polling it out."""
+        # Uses the default (real) clock; the fake clock never blocks
+        widgets = {name: _inert_widget() for name in _WIDGET_NAMES}
+
+        # The loop updates the time label once before it starts and once per
+        # tick just before waiting; the second update means it is in its tick
+        updates = []
+        in_tick = threading.Event()
+
+        def configure(**kwargs):
+            updates.append(kwargs)
+            if len(updates) >= 2:
+                in_tick.set()
+
+        widgets["time_label"].configure = configure
+        service = CountdownService(widgets)
+        starter = threading.Thread(target=service.start_countdown, args=(30,), daemon=True)
+        starter.start()
+
+        assert in_tick.wait(timeout=2.0)
+        countdown_thread = service._thread
+
+        started = time.monotonic()
+        service.stop()
+
+        # Without the event the thread would sleep out the rest of its 1s tick
+        assert time.monotonic() - started < 0.5
+        assert not countdown_thread.is_alive()
+        starter.join(timeout=1.0)
+        assert service.is_cancelled() is True
+
     @pytest.mark.unit
     def test_is_active_true(self, service):
         """Test countdown active status when true."""
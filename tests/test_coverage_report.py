@@ -4,186 +4,228 @@ Test Coverage Report
 Generates a comprehensive report of test coverage for the application.
 """
 
-import sys
-from pathlib import Path
-from typing import Dict, List
-
-
-def get_test_files() -> List[str]:
-    """Get all test files in the tests directory."""
-    tests_dir = Path("tests")
-    test_files = []
-
-    if tests_dir.exists():
-        for file in tests_dir.glob("test_*.py"):
-            test_files.append(str(file))
-
-    return test_files
-
-def get_source_files() -> List[str]:
-    """Get all source files in the src directory."""
-    src_dir = Path("src")
-    source_files = []
-
-    if src_dir.exists():
-        for file in src_dir.glob("*.py"):
-            source_files.append(str(file))
-
-    return source_files
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Bounded so a large tree doesn't oversubscribe the disk / file cache
+_SCAN_WORKERS = 8
+
+# Report separators, built once
+_RULE = "=" * 80
+_SEP = _RULE + "\n"
+_SUB = "-" * 40 + "\n"
+
+# Test files (by basename) counted towards each coverage category
+_CORE_TESTS = frozenset({"test_automator.py", "test_thread_safety.py", "test_ui_session.py"})
+_SERVICE_TESTS = frozenset({
+    "test_coordinate_service.py", "test_countdown_service.py",
+    "test_file_service.py", "test_flexible_parser.py",
+})
+_THREAD_SAFETY_TESTS = frozenset({"test_thread_safety.py"})
+_UI_SESSION_TESTS = frozenset({"test_ui_session.py"})
+
+
+@lru_cache(maxsize=None)
+def _scan_file_cached(path: str, mtime_ns: int) -> tuple[int, int, int]:
+    """Return (lines, code_lines, test_methods) for a file in one streaming pass.
+
+    Only one line is held at a time. Results are cached per (path, mtime), so
+    repeated analyses skip unchanged files but pick up edited ones.
+    """
+    total = code = tests = 0
+    with open(path, "rb") as f:
+        for line in f:
+            total += 1
+            stripped = line.lstrip()
+            if stripped and not stripped.startswith(b"#"):
+                code += 1
+                if stripped.startswith(b"def test_"):
+                    tests += 1
+    return total, code, tests
+
+def _scan_file(path: str) -> tuple[int, int, int]:
+    """Scan a file, reusing the cached result while its mtime is unchanged."""
+    return _scan_file_cached(path, os.stat(path).st_mtime_ns)
+
+def _iter_py_files(directory: str, prefix: str = "") -> Iterator[str]:
+    """Yield the .py files directly in a directory whose names start with prefix."""
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.name.endswith(".py") and entry.is_file():
+                yield entry.path
+
+def get_test_files() -> Iterator[str]:
+    """Yield all test files in the tests directory."""
+    return _iter_py_files("tests", "test_")
+
+def get_source_files() -> Iterator[str]:
+    """Yield all source files in the src directory."""
+    return _iter_py_files("src")
+
+def _recorded(paths: Iterable[str], seen: list[str]) -> Iterator[str]:
+    """Pass paths through, appending each to seen as it is consumed."""
+    for path in paths:
+        seen.append(path)
+        yield path
 
 def count_test_methods(test_file: str) -> int:
     """Count the number of test methods in a test file."""
     try:
-        with open(test_file, encoding="utf-8") as f:
-            content = f.read()
-            # Count lines that start with "def test_"
-            test_methods = [line for line in content.split("\n")
-                          if line.strip().startswith("def test_")]
-            return len(test_methods)
-    except Exception:
+        # Count lines that start with "def test_"
+        return _scan_file(test_file)[2]
+    except OSError:  # Vanished or unreadable since it was listed
         return 0
 
-def analyze_test_coverage() -> Dict[str, any]:
+def _analyze_source(source_file: str) -> dict[str, int]:
+    """Line and code-line counts for a source file (zeros if it can't be read)."""
+    try:
+        line_count, code_lines, _ = _scan_file(source_file)
+    except OSError:  # Vanished or unreadable since it was listed
+        return {"lines": 0, "code_lines": 0}
+    return {"lines": line_count, "code_lines": code_lines}
+
+def analyze_test_coverage() -> dict[str, object]:
     """Analyze test coverage and return a comprehensive report."""
-    test_files = get_test_files()
-    source_files = get_source_files()
-
-    # Count test methods in each file
-    test_methods_by_file = {}
-    total_test_methods = 0
-
-    for test_file in test_files:
-        method_count = count_test_methods(test_file)
-        test_methods_by_file[test_file] = method_count
-        total_test_methods += method_count
-
-    # Analyze source files
-    source_analysis = {}
-    total_source_lines = 0
-
-    for source_file in source_files:
-        try:
-            with open(source_file, encoding="utf-8") as f:
-                lines = f.readlines()
-                source_analysis[source_file] = {
-                    "lines": len(lines),
-                    "code_lines": len([line for line in lines if line.strip() and not line.strip().startswith("#")]),
-                }
-                total_source_lines += len(lines)
-        except Exception:
-            source_analysis[source_file] = {"lines": 0, "code_lines": 0}
+    # The listings feed the pool directly, so workers start reading the first
+    # files while the directories are still being enumerated; the paths are
+    # recorded on the way through for the report. File reads release the GIL,
+    # and map() keeps results in input order
+    test_files: list[str] = []
+    source_files: list[str] = []
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        test_results = executor.map(count_test_methods, _recorded(get_test_files(), test_files))
+        source_results = executor.map(_analyze_source, _recorded(get_source_files(), source_files))
+        test_counts = list(test_results)
+        source_stats = list(source_results)
+
+    # Per-file numbers are kept as lists aligned with test_files/source_files;
+    # the per-file dicts are views built from them for the listings
+    source_lines = [stats["lines"] for stats in source_stats]
+    source_code_lines = [stats["code_lines"] for stats in source_stats]
 
     return {
         "test_files": test_files,
         "source_files": source_files,
-        "test_methods_by_file": test_methods_by_file,
-        "total_test_methods": total_test_methods,
-        "source_analysis": source_analysis,
-        "total_source_lines": total_source_lines,
+        "test_counts": test_counts,
+        "source_lines": source_lines,
+        "source_code_lines": source_code_lines,
+        "test_methods_by_file": dict(zip(test_files, test_counts)),
+        "total_test_methods": sum(test_counts),
+        "source_analysis": dict(zip(source_files, source_stats)),
+        "total_source_lines": sum(source_lines),
     }
 
+def _category_totals(analysis: dict[str, object]) -> tuple[int, int, int, int]:
+    """Total test methods per category (core, service, thread safety, UI session).
+
+    One walk over the test files; a file can count towards several categories.
+    """
+    core = service = thread_safety = ui_session = 0
+    for path, count in zip(analysis["test_files"], analysis["test_counts"]):
+        name = os.path.basename(path)
+        if name in _CORE_TESTS:
+            core += count
+        if name in _SERVICE_TESTS:
+            service += count
+        if name in _THREAD_SAFETY_TESTS:
+            thread_safety += count
+        if name in _UI_SESSION_TESTS:
+            ui_session += count
+    return core, service, thread_safety, ui_session
+
 def generate_coverage_report() -> str:
     """Generate a comprehensive coverage report."""
     analysis = analyze_test_coverage()
 
-    report = []
-    report.append("=" * 80)
-    report.append("TEST COVERAGE REPORT")
-    report.append("=" * 80)
-    report.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(_SEP)
+    w("TEST COVERAGE REPORT\n")
+    w(_SEP)
+    w("\n")
 
     # Test Files Summary
-    report.append("📁 TEST FILES SUMMARY")
-    report.append("-" * 40)
-    report.append(f"Total test files: {len(analysis['test_files'])}")
-    report.append(f"Total test methods: {analysis['total_test_methods']}")
-    report.append("")
+    w("📁 TEST FILES SUMMARY\n")
+    w(_SUB)
+    w(f"Total test files: {len(analysis['test_files'])}\n")
+    w(f"Total test methods: {analysis['total_test_methods']}\n")
+    w("\n")
 
     for test_file, method_count in analysis["test_methods_by_file"].items():
-        report.append(f"  {test_file}: {method_count} test methods")
-    report.append("")
+        w(f"  {test_file}: {method_count} test methods\n")
+    w("\n")
 
     # Source Files Summary
-    report.append("📁 SOURCE FILES SUMMARY")
-    report.append("-" * 40)
-    report.append(f"Total source files: {len(analysis['source_files'])}")
-    report.append(f"Total source lines: {analysis['total_source_lines']}")
-    report.append("")
+    w("📁 SOURCE FILES SUMMARY\n")
+    w(_SUB)
+    w(f"Total source files: {len(analysis['source_files'])}\n")
+    w(f"Total source lines: {analysis['total_source_lines']}\n")
+    w("\n")
 
     for source_file, stats in analysis["source_analysis"].items():
-        report.append(f"  {source_file}: {stats['lines']} lines ({stats['code_lines']} code)")
-    report.append("")
+        w(f"  {source_file}: {stats['lines']} lines ({stats['code_lines']} code)\n")
+    w("\n")
 
     # Coverage Categories
-    report.append("📊 COVERAGE CATEGORIES")
-    report.append("-" * 40)
-
-    # Core functionality tests
-    core_tests = ["test_automator.py", "test_thread_safety.py", "test_ui_session.py"]
-    core_test_methods = sum(analysis["test_methods_by_file"].get(f"tests/{test}", 0)
-                           for test in core_tests)
-    report.append(f"Core functionality tests: {core_test_methods} methods")
-
-    # Service tests
-    service_tests = ["test_coordinate_service.py", "test_countdown_service.py",
-                    "test_file_service.py", "test_flexible_parser.py"]
-    service_test_methods = sum(analysis["test_methods_by_file"].get(f"tests/{test}", 0)
-                              for test in service_tests)
-    report.append(f"Service tests: {service_test_methods} methods")
-
-    # Thread safety tests
-    thread_safety_tests = ["test_thread_safety.py"]
-    thread_safety_methods = sum(analysis["test_methods_by_file"].get(f"tests/{test}", 0)
-                               for test in thread_safety_tests)
-    report.append(f"Thread safety tests: {thread_safety_methods} methods")
-
-    # UI session tests
-    ui_session_tests = ["test_ui_session.py"]
-    ui_session_methods = sum(analysis["test_methods_by_file"].get(f"tests/{test}", 0)
-                            for test in ui_session_tests)
-    report.append(f"UI session tests: {ui_session_methods} methods")
-    report.append("")
+    w("📊 COVERAGE CATEGORIES\n")
+    w(_SUB)
+
+    core_test_methods, service_test_methods, thread_safety_methods, ui_session_methods = (
+        _category_totals(analysis)
+    )
+    w(f"Core functionality tests: {core_test_methods} methods\n")
+    w(f"Service tests: {service_test_methods} methods\n")
+    w(f"Thread safety tests: {thread_safety_methods} methods\n")
+    w(f"UI session tests: {ui_session_methods} methods\n")
+    w("\n")
 
     # Test Coverage Assessment
-    report.append("📈 TEST COVERAGE ASSESSMENT")
-    report.append("-" * 40)
+    w("📈 TEST COVERAGE ASSESSMENT\n")
+    w(_SUB)
 
     total_tests = analysis["total_test_methods"]
     total_source_files = len(analysis["source_files"])
 
     if total_source_files > 0:
         tests_per_file = total_tests / total_source_files
-        report.append(f"Average tests per source file: {tests_per_file:.1f}")
+        w(f"Average tests per source file: {tests_per_file:.1f}\n")
 
     # Coverage recommendations
-    report.append("")
-    report.append("🎯 COVERAGE RECOMMENDATIONS")
-    report.append("-" * 40)
+    w("\n")
+    w("🎯 COVERAGE RECOMMENDATIONS\n")
+    w(_SUB)
 
     if core_test_methods < 20:
-        report.append("⚠️  Core functionality tests need more coverage")
+        w("⚠️  Core functionality tests need more coverage\n")
     else:
-        report.append("✅ Core functionality tests have good coverage")
+        w("✅ Core functionality tests have good coverage\n")
 
     if thread_safety_methods < 10:
-        report.append("⚠️  Thread safety tests need more coverage")
+        w("⚠️  Thread safety tests need more coverage\n")
     else:
-        report.append("✅ Thread safety tests have good coverage")
+        w("✅ Thread safety tests have good coverage\n")
 
     if ui_session_methods < 10:
-        report.append("⚠️  UI session tests need more coverage")
+        w("⚠️  UI session tests need more coverage\n")
     else:
-        report.append("✅ UI session tests have good coverage")
+        w("✅ UI session tests have good coverage\n")
 
     if service_test_methods < 50:
-        report.append("⚠️  Service tests need more coverage")
+        w("⚠️  Service tests need more coverage\n")
     else:
-        report.append("✅ Service tests have good coverage")
+        w("✅ Service tests have good coverage\n")
 
-    report.append("")
-    report.append("=" * 80)
+    w("\n")
+    w(_RULE)  # Last line has no trailing newline
 
-    return "\n".join(report)
+    return buf.getvalue()
 
 def main():
     """Main function to generate and display the coverage report."""
@@ -192,8 +234,8 @@ def main():
         print(report)
 
         # Save report to file
-        with open("test_coverage_report.txt", "w", encoding="utf-8") as f:
-            f.write(report)
+        with open("test_coverage_report.txt", "wb") as f:
+            f.write(report.encode("utf-8"))
 
         print("\n📄 Coverage report saved to: test_coverage_report.txt")
 
@@ -204,4 +246,6 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    import sys
+
     sys.exit(main())
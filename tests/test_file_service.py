@@ -8,27 +8,91 @@ import os
 
 import pytest
 
-from file_service import PromptListService
+from file_service import MMAP_THRESHOLD, PromptListService
+
+_SAMPLE_PROMPTS = (
+    "This is a test prompt",
+    "Another test prompt with 'quotes'",
+    "Multi-line\nprompt with\nline breaks",
+    "Simple prompt",
+    "Prompt with special chars: !@#$%^&*()",
+)
+
+_SINGLE_LINE_PROMPTS = (
+    "This is a test prompt",
+    "Another test prompt with 'quotes'",
+    "Simple prompt",
+    "Prompt with special chars: !@#$%^&*()",
+)
+
+# Canonical files for the parse tests, written once per module by seeded_files
+_SEEDED_FILES = {
+    "prompts.py": (
+        "# Test prompts\nprompt_list = [\n"
+        # Escape newlines for Python syntax
+        + "".join('    "{}",\n'.format(p.replace("\n", "\\n")) for p in _SAMPLE_PROMPTS)
+        + "]\n"
+    ),
+    "comments.py": (
+        "# Test prompts\n"
+        "prompt_list = [\n"
+        '    "First prompt",  # Comment\n'
+        '    "Second prompt",\n'
+        "]\n"
+    ),
+    "multi_line_strings.py": (
+        "prompt_list = [\n"
+        '    """Multi-line\n'
+        '    prompt""",\n'
+        '    "Single line prompt",\n'
+        "]\n"
+    ),
+    # Missing closing bracket
+    "syntax_error.py": 'prompt_list = [\n    "First prompt",\n    "Second prompt",\n',
+    "other_variable.py": "# No prompt_list here\nother_variable = ['test']\n",
+    "not_a_list.py": 'prompt_list = "not a list"\n',
+    "prompts.txt": "".join(p + "\n" for p in _SINGLE_LINE_PROMPTS),
+    "empty_lines.txt": "First prompt\n\nSecond prompt\n\nThird prompt\n",
+    "empty.txt": "",
+    "prompts.csv": "index,prompt\n"
+    + "".join(f"{i},{p}\n" for i, p in enumerate(_SINGLE_LINE_PROMPTS, 1)),
+    "quoted.csv": 'index,prompt\n1,"Prompt with, comma"\n2,"Prompt with ""quotes"""\n',
+    "spaced_quotes.csv": 'index,prompt\n1, "First, prompt"\n2, "Second prompt"\n',
+    "no_header.csv": "First prompt\nSecond prompt\n",
+    "wrong_header.csv": "wrong,header\n1,First prompt\n2,Second prompt\n",
+    "empty.csv": "",
+    "prompts.xyz": "Some content",
+}
+
+
+@pytest.fixture(scope="module")
+def seeded_files(tmp_path_factory):
+    """Write the canonical parse-test files once; maps file name to path.
+
+    Parsing never modifies them, so tests share them read-only.
+    """
+    directory = tmp_path_factory.mktemp("seeded_prompts")
+    paths = {}
+    for name, content in _SEEDED_FILES.items():
+        path = directory / name
+        path.write_bytes(content.encode("utf-8"))
+        paths[name] = str(path)
+    return paths
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Create one service instance for the module (it keeps no per-call state)."""
+    return PromptListService()
 
 
 class TestPromptListService:
     """Test cases for PromptListService."""
 
-    @pytest.fixture
-    def service(self):
-        """Create a fresh service instance for each test."""
-        return PromptListService()
-
     @pytest.fixture
     def sample_prompts(self):
         """Sample prompts for testing."""
-        return [
-            "This is a test prompt",
-            "Another test prompt with 'quotes'",
-            "Multi-line\nprompt with\nline breaks",
-            "Simple prompt",
-            "Prompt with special chars: !@#$%^&*()",
-        ]
+        return list(_SAMPLE_PROMPTS)
 
     @pytest.mark.unit
     def test_init(self, service):
@@ -36,129 +100,82 @@ class TestPromptListService:
         assert service is not None
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_success(self, service, sample_prompts, temp_dir):
+    def test_parse_prompt_list_python_success(self, service, sample_prompts, seeded_files):
         """Test successful Python file parsing."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file with prompts
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("# Test prompts\n")
-            f.write("prompt_list = [\n")
-            for prompt in sample_prompts:
-                # Escape newlines for Python syntax
-                escaped_prompt = prompt.replace("\n", "\\n")
-                f.write(f'    "{escaped_prompt}",\n')
-            f.write("]\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["prompts.py"])
 
         assert success is True
         assert result == sample_prompts
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_with_comments(self, service, temp_dir):
+    def test_parse_prompt_list_python_with_comments(self, service, seeded_files):
         """Test Python file parsing with comments."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file with comments
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("# Test prompts\n")
-            f.write("prompt_list = [\n")
-            f.write('    "First prompt",  # Comment\n')
-            f.write('    "Second prompt",\n')
-            f.write("]\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["comments.py"])
 
         assert success is True
         assert result == ["First prompt", "Second prompt"]
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_multi_line_strings(self, service, temp_dir):
+    def test_parse_prompt_list_python_multi_line_strings(self, service, seeded_files):
         """Test Python file parsing with multi-line strings."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file with multi-line strings
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("prompt_list = [\n")
-            f.write('    """Multi-line\n')
-            f.write('    prompt""",\n')
-            f.write('    "Single line prompt",\n')
-            f.write("]\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["multi_line_strings.py"])
 
         assert success is True
         assert result == ["Multi-line\n    prompt", "Single line prompt"]
 
     @pytest.mark.unit
-    def test_parse_prompt_list_text_success(self, service, temp_dir):
+    def test_parse_prompt_list_text_success(self, service, seeded_files):
         """Test successful text file parsing."""
-        test_file = os.path.join(temp_dir, "test_prompts.txt")
-
-        # Create a text file with single-line prompts
-        text_prompts = ["This is a test prompt", "Another test prompt with 'quotes'", "Simple prompt", "Prompt with special chars: !@#$%^&*()"]
-
-        with open(test_file, "w", encoding="utf-8") as f:
-            for prompt in text_prompts:
-                f.write(prompt + "\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["prompts.txt"])
 
         assert success is True
-        assert result == text_prompts
+        assert result == list(_SINGLE_LINE_PROMPTS)
 
     @pytest.mark.unit
-    def test_parse_prompt_list_text_with_empty_lines(self, service, temp_dir):
+    def test_parse_prompt_list_text_with_empty_lines(self, service, seeded_files):
         """Test text file parsing with empty lines."""
-        test_file = os.path.join(temp_dir, "test_prompts.txt")
-
-        # Create a text file with empty lines
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("First prompt\n")
-            f.write("\n")  # Empty line
-            f.write("Second prompt\n")
-            f.write("\n")  # Empty line
-            f.write("Third prompt\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["empty_lines.txt"])
 
         assert success is True
         assert result == ["First prompt", "Second prompt", "Third prompt"]
 
     @pytest.mark.unit
-    def test_parse_prompt_list_csv_success(self, service, temp_dir):
-        """Test successful CSV file parsing."""
-        test_file = os.path.join(temp_dir, "test_prompts.csv")
+    def test_parse_prompt_list_large_text_file(self, service, temp_dir):
+        """Test a memory-mapped text file with Windows line endings."""
+        prompts = [f"Prompt number {i}" for i in range(MMAP_THRESHOLD // 10)]
+        test_file = os.path.join(temp_dir, "large.txt")
+        with open(test_file, "wb") as f:
+            f.write("\r\n".join(prompts).encode("utf-8"))
+        assert os.path.getsize(test_file) >= MMAP_THRESHOLD
 
-        # Create a CSV file with single-line prompts
-        csv_prompts = ["This is a test prompt", "Another test prompt with 'quotes'", "Simple prompt", "Prompt with special chars: !@#$%^&*()"]
+        success, result = service.parse_prompt_list(test_file)
 
-        with open(test_file, "w", encoding="utf-8", newline="") as f:
-            f.write("index,prompt\n")
-            for i, prompt in enumerate(csv_prompts, 1):
-                f.write(f"{i},{prompt}\n")
+        assert success is True
+        assert result == prompts
 
-        success, result = service.parse_prompt_list(test_file)
+    @pytest.mark.unit
+    def test_parse_prompt_list_csv_success(self, service, seeded_files):
+        """Test successful CSV file parsing."""
+        success, result = service.parse_prompt_list(seeded_files["prompts.csv"])
 
         assert success is True
-        assert result == csv_prompts
+        assert result == list(_SINGLE_LINE_PROMPTS)
 
     @pytest.mark.unit
-    def test_parse_prompt_list_csv_with_quotes(self, service, temp_dir):
+    def test_parse_prompt_list_csv_with_quotes(self, service, seeded_files):
         """Test CSV file parsing with quoted prompts."""
-        test_file = os.path.join(temp_dir, "test_prompts.csv")
+        success, result = service.parse_prompt_list(seeded_files["quoted.csv"])
 
-        # Create a CSV file with quoted prompts
-        with open(test_file, "w", encoding="utf-8", newline="") as f:
-            f.write("index,prompt\n")
-            f.write('1,"Prompt with, comma"\n')
-            f.write('2,"Prompt with ""quotes"""\n')
+        assert success is True
+        assert result == ["Prompt with, comma", 'Prompt with "quotes"']
 
-        success, result = service.parse_prompt_list(test_file)
+    @pytest.mark.unit
+    def test_parse_prompt_list_csv_quoted_after_space(self, service, seeded_files):
+        """Test CSV file parsing with a space before each quoted prompt."""
+        success, result = service.parse_prompt_list(seeded_files["spaced_quotes.csv"])
 
         assert success is True
-        assert result == ["Prompt with, comma", 'Prompt with "quotes"']
+        assert result == ["First, prompt", "Second prompt"]
 
     @pytest.mark.unit
     def test_parse_prompt_list_file_not_found(self, service):
@@ -169,46 +186,25 @@ class TestPromptListService:
         assert "File not found" in result
 
     @pytest.mark.unit
-    def test_parse_prompt_list_unsupported_format(self, service, temp_dir):
+    def test_parse_prompt_list_unsupported_format(self, service, seeded_files):
         """Test parsing unsupported file format."""
-        test_file = os.path.join(temp_dir, "test_prompts.xyz")
-
-        # Create a file with unsupported extension
-        with open(test_file, "w") as f:
-            f.write("Some content")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["prompts.xyz"])
 
         assert success is False
         assert "Unsupported file format" in result
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_syntax_error(self, service, temp_dir):
+    def test_parse_prompt_list_python_syntax_error(self, service, seeded_files):
         """Test Python file parsing with syntax error."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file with syntax error
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("prompt_list = [\n")
-            f.write('    "First prompt",\n')
-            f.write('    "Second prompt",\n')  # Missing closing bracket
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["syntax_error.py"])
 
         assert success is False
         assert "syntax error" in result.lower()
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_no_prompt_list(self, service, temp_dir):
+    def test_parse_prompt_list_python_no_prompt_list(self, service, seeded_files):
         """Test Python file parsing without prompt_list variable."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file without prompt_list
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write("# No prompt_list here\n")
-            f.write("other_variable = ['test']\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["other_variable.py"])
 
         # With the improved parser, it will find the other_variable and use it
         # This is actually better behavior - the parser is more flexible
@@ -217,78 +213,58 @@ class TestPromptListService:
         assert result[0] == "test"
 
     @pytest.mark.unit
-    def test_parse_prompt_list_python_prompt_list_not_list(self, service, temp_dir):
+    def test_parse_prompt_list_python_prompt_list_not_list(self, service, seeded_files):
         """Test Python file parsing with prompt_list not being a list."""
-        test_file = os.path.join(temp_dir, "test_prompts.py")
-
-        # Create a Python file with prompt_list as string
-        with open(test_file, "w", encoding="utf-8") as f:
-            f.write('prompt_list = "not a list"\n')
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["not_a_list.py"])
 
         assert success is False
         assert "No valid prompt lists found" in result
 
     @pytest.mark.unit
-    def test_parse_prompt_list_text_empty_file(self, service, temp_dir):
+    def test_parse_prompt_list_text_empty_file(self, service, seeded_files):
         """Test text file parsing with empty file."""
-        test_file = os.path.join(temp_dir, "test_prompts.txt")
-
-        # Create an empty text file
-        with open(test_file, "w", encoding="utf-8") as f:
-            pass
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["empty.txt"])
 
         assert success is True
         assert result == []
 
     @pytest.mark.unit
-    def test_parse_prompt_list_csv_empty_file(self, service, temp_dir):
+    def test_parse_prompt_list_csv_empty_file(self, service, seeded_files):
         """Test CSV file parsing with empty file."""
-        test_file = os.path.join(temp_dir, "test_prompts.csv")
-
-        # Create an empty CSV file
-        with open(test_file, "w", encoding="utf-8", newline="") as f:
-            pass
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["empty.csv"])
 
         assert success is True
         assert result == []
 
     @pytest.mark.unit
-    def test_parse_prompt_list_csv_no_header(self, service, temp_dir):
+    def test_parse_prompt_list_csv_no_header(self, service, seeded_files):
         """Test CSV file parsing without header."""
-        test_file = os.path.join(temp_dir, "test_prompts.csv")
-
-        # Create a CSV file without header
-        with open(test_file, "w", encoding="utf-8", newline="") as f:
-            f.write("First prompt\n")
-            f.write("Second prompt\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["no_header.csv"])
 
         assert success is True
         assert result == ["First prompt", "Second prompt"]
 
     @pytest.mark.unit
-    def test_parse_prompt_list_csv_wrong_header(self, service, temp_dir):
+    def test_parse_prompt_list_csv_wrong_header(self, service, seeded_files):
         """Test CSV file parsing with wrong header."""
-        test_file = os.path.join(temp_dir, "test_prompts.csv")
-
-        # Create a CSV file with wrong header
-        with open(test_file, "w", encoding="utf-8", newline="") as f:
-            f.write("wrong,header\n")
-            f.write("1,First prompt\n")
-            f.write("2,Second prompt\n")
-
-        success, result = service.parse_prompt_list(test_file)
+        success, result = service.parse_prompt_list(seeded_files["wrong_header.csv"])
 
         assert success is True
         assert result == ["First prompt", "Second prompt"]
 
+    @pytest.mark.unit
+    def test_parse_many(self, service, seeded_files):
+        """Test parsing several files at once matches parsing each in turn."""
+        paths = [
+            seeded_files[name]
+            for name in ("prompts.py", "empty_lines.txt", "quoted.csv", "prompts.xyz")
+        ]
+
+        results = service.parse_many(paths, max_workers=2)
+
+        assert list(results) == paths
+        assert results == {path: service.parse_prompt_list(path) for path in paths}
+
     @pytest.mark.unit
     def test_save_prompts_python_success(self, service, temp_dir):
         """Test successful Python file saving."""
@@ -309,6 +285,19 @@ class TestPromptListService:
             for prompt in test_prompts:
                 assert prompt in content
 
+    @pytest.mark.unit
+    def test_save_and_parse_python_round_trip(self, service, temp_dir):
+        """Test that saved Python prompts with quotes, backslashes and newlines parse back."""
+        test_file = os.path.join(temp_dir, "round_trip_prompts.py")
+        test_prompts = ['Say "hi"', "It's done", "C:\\new\\table", "Multi-line\nprompt"]
+
+        assert service.save_prompts(test_file, test_prompts) is True
+
+        success, result = service.parse_prompt_list(test_file)
+
+        assert success is True
+        assert result == test_prompts
+
     @pytest.mark.unit
     def test_save_prompts_text_success(self, service, temp_dir):
         """Test successful text file saving."""
@@ -348,6 +337,19 @@ class TestPromptListService:
             assert len(lines) == len(test_prompts) + 1  # +1 for header
             assert lines[0].strip() == "index,prompt"
 
+    @pytest.mark.unit
+    def test_save_and_parse_csv_round_trip(self, service, temp_dir):
+        """Test that saved CSV prompts with quotes, commas and newlines parse back."""
+        test_file = os.path.join(temp_dir, "test_prompts.csv")
+        test_prompts = ['Say "hi"', "Comma, inside", "Multi-line\nprompt"]
+
+        assert service.save_prompts(test_file, test_prompts) is True
+
+        success, result = service.parse_prompt_list(test_file)
+
+        assert success is True
+        assert result == test_prompts
+
     @pytest.mark.unit
     def test_save_prompts_unsupported_format(self, service, temp_dir):
         """Test saving with unsupported format."""
@@ -395,6 +397,7 @@ class TestPromptListService:
         assert service._validate_file_path("test.py") is True
         assert service._validate_file_path("") is False
         assert service._validate_file_path(None) is False
+        assert service._validate_file_path(b"test.py") is False
 
     @pytest.mark.unit
     def test_create_directory_if_needed(self, service, temp_dir):
@@ -5,22 +5,22 @@ Tests various parsing strategies and formats to ensure maximum flexibility
 for users to format their prompt lists however they prefer.
 """
 
+import json
+import os
+import time
+from types import SimpleNamespace
 
-try:
-    from src.parser_service import ParserService
-except ImportError:
-    # Fallback for when running as script
-    import sys
-    sys.path.insert(0, "src")
-    from parser_service import ParserService
+import src.parser_service as parser_service
+from src.parser_service import ParserService
 
 
 class TestFlexibleParser:
     """Test the flexible parsing capabilities."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = ParserService()
+    @classmethod
+    def setup_class(cls):
+        """Set up test fixtures (ParserService is stateless, so one is shared)."""
+        cls.parser = ParserService()
 
     def test_parse_python_any_variable_name(self):
         """Test that Python files work with any variable name."""
@@ -193,6 +193,88 @@ my_list = ["prompt1", "prompt2", "prompt3"]
         assert len(result) == 2  # Empty strings should be filtered out
         assert result == ["prompt1", "prompt2"]
 
+    def test_parse_python_ast_result_cached_by_source_hash(self, tmp_path, monkeypatch):
+        """Test that unchanged content is served from the AST cache."""
+        monkeypatch.setattr(parser_service, "_AST_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(parser_service, "_PARSED_PROMPTS", {})
+        # Two lists, so the single-list fast path doesn't apply
+        content = 'cached_list = ["alpha", "beta"]\nother = ["x"]'
+        assert self.parser._parse_python_content_ast(content) == (True, ["alpha", "beta"])
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        def no_parse(_content):
+            raise AssertionError("content was re-parsed")
+
+        monkeypatch.setattr(parser_service, "_ast_string_list", no_parse)
+        # In-process hit, then on-disk hit after the in-process cache is dropped
+        assert self.parser._parse_python_content_ast(content) == (True, ["alpha", "beta"])
+        parser_service._PARSED_PROMPTS.clear()
+        assert self.parser._parse_python_content_ast(content) == (True, ["alpha", "beta"])
+
+    def test_parse_python_ast_cache_ignores_stale_entries(self, tmp_path, monkeypatch):
+        """Test that disk cache entries from another parser version are re-parsed."""
+        monkeypatch.setattr(parser_service, "_AST_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(parser_service, "_PARSED_PROMPTS", {})
+        content = 'stale_list = ["fresh"]\nother = []'
+        self.parser._parse_python_content_ast(content)
+        (entry,) = tmp_path.glob("*.json")
+        entry.write_text(json.dumps({"tag": [0, 0, 0], "prompts": ["stale"]}), encoding="utf-8")
+        parser_service._PARSED_PROMPTS.clear()
+
+        assert self.parser._parse_python_content_ast(content) == (True, ["fresh"])
+
+    def test_parse_python_fast_path_skips_disk_cache(self, tmp_path, monkeypatch):
+        """Test that a lone plain list is neither read from nor written to disk."""
+        monkeypatch.setattr(parser_service, "_AST_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(parser_service, "_PARSED_PROMPTS", {})
+
+        def no_load(_src_hash):
+            raise AssertionError("disk cache was read")
+
+        monkeypatch.setattr(parser_service, "_load_cached_prompts", no_load)
+        content = 'plain_list = ["alpha", "beta"]'
+        assert self.parser._parse_python_content_ast(content) == (True, ["alpha", "beta"])
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_parse_python_ast_cache_pruned_to_max_entries(self, tmp_path, monkeypatch):
+        """Test that the oldest disk cache entries are dropped past the cap."""
+        monkeypatch.setattr(parser_service, "_AST_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(parser_service, "_AST_CACHE_MAX_ENTRIES", 2)
+        for age, name in enumerate(("newest", "middle", "oldest")):
+            entry = tmp_path / f"{name}.json"
+            entry.write_text("{}", encoding="utf-8")
+            os.utime(entry, (1000 - age, 1000 - age))
+
+        parser_service._store_cached_prompts("fresh", ("prompt",))
+
+        remaining = sorted(path.stem for path in tmp_path.glob("*.json"))
+        assert remaining == ["fresh", "newest"]
+
+    def test_parse_python_single_plain_list_skips_ast(self, monkeypatch):
+        """Test that a lone list of plain literals is read without ast.parse."""
+
+        def no_parse(_content):
+            raise AssertionError("ast.parse was called")
+
+        monkeypatch.setattr(parser_service, "ast", SimpleNamespace(parse=no_parse))
+        content = '# header\nprompts = [\n    "one",\n    \'it"s two\',\n    "",\n]\n'
+        assert parser_service._largest_string_list(content) == ("one", 'it"s two')
+
+    def test_parse_python_escaped_literals_fall_back_to_ast(self):
+        """Test that literals the fast path can't decode still parse correctly."""
+        content = 'prompts = ["tab\\there", "it\\\'s", r"raw"]'
+        assert parser_service._largest_string_list(content) == ("tab\there", "it's", "raw")
+
+    def test_parse_python_comment_banner_rejected_promptly(self):
+        """Test that a "#" banner over a non-plain list doesn't backtrack."""
+        banner = "#" * 80
+        content = f"{banner}\n# Prompts\n{banner}\nx = [1, \"a\"]\n"
+        start = time.perf_counter()
+        success, result = self.parser._parse_python_content_ast(content)
+        assert time.perf_counter() - start < 1.0
+        assert not success
+        assert "No valid prompt lists found" in result
+
     def test_parse_text_with_empty_lines(self):
         """Test text parsing with empty lines."""
         content = "prompt1\n\n\nprompt2\n\nprompt3"
@@ -8,28 +8,20 @@ This module provides comprehensive testing for:
 4. Integration tests for paste + UI interaction
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-# Import with fallback for relative import issues
-try:
-    from src.automation_controller import AutomationController
-    from src.automation_integration import SessionController
-    from src.automator import paste_text_safely, perform_paste_operation
-except ImportError:
-    # Fallback for when running tests directly
-    import os
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-    from automation_controller import AutomationController
-    from automation_integration import SessionController
-    from automator import paste_text_safely, perform_paste_operation
+from src.automation_controller import AutomationController
+from src.automation_integration import SessionController
+from src.automator import paste_text_safely, perform_paste_operation
 
 # Import test utilities
 from .test_utils import create_mock_ui_session
 
 
+@pytest.mark.paste_class
 class TestPasteOperations:
     """Test cases for paste operations."""
 
@@ -52,13 +44,14 @@ class TestPasteOperations:
             yield mock_clip
 
     @pytest.fixture
-    def mock_time(self):
-        """Mock time module for testing."""
-        with patch("src.automator.time") as mock_time:
-            mock_time.sleep.return_value = None
-            yield mock_time
-
-    def test_perform_paste_operation_success(self, mock_pyautogui, mock_time):
+    def sleep_calls(self, monkeypatch):
+        """Record the automator's sleeps instead of sleeping; returns the delays."""
+        sleeps = []
+        monkeypatch.setattr("src.automator.time", SimpleNamespace(sleep=sleeps.append))
+        return sleeps
+
+    @pytest.mark.paste_smoke
+    def test_perform_paste_operation_success(self, mock_pyautogui, sleep_calls):
         """Test successful paste operation."""
         text = "Test prompt text"
 
@@ -69,9 +62,9 @@ class TestPasteOperations:
         mock_pyautogui.click.assert_called_once()  # Focus
         mock_pyautogui.hotkey.assert_any_call("ctrl", "a")  # Select all
         mock_pyautogui.hotkey.assert_any_call("ctrl", "v")  # Paste
-        assert mock_time.sleep.call_count >= 2  # Should have delays
+        assert len(sleep_calls) >= 2  # Should have delays
 
-    def test_perform_paste_operation_ctrl_v_failure_fallback(self, mock_pyautogui, mock_time):
+    def test_perform_paste_operation_ctrl_v_failure_fallback(self, mock_pyautogui, sleep_calls):
         """Test paste operation when Ctrl+V fails and falls back to direct input."""
         text = "Test prompt text"
 
@@ -88,7 +81,7 @@ class TestPasteOperations:
         assert result is True
         mock_pyautogui.write.assert_called_once_with(text)
 
-    def test_perform_paste_operation_complete_failure(self, mock_pyautogui, mock_time):
+    def test_perform_paste_operation_complete_failure(self, mock_pyautogui, sleep_calls):
         """Test paste operation when both methods fail."""
         text = "Test prompt text"
 
@@ -100,7 +93,7 @@ class TestPasteOperations:
 
         assert result is False
 
-    def test_perform_paste_operation_timing_verification(self, mock_pyautogui, mock_time):
+    def test_perform_paste_operation_timing_verification(self, mock_pyautogui, sleep_calls):
         """Test that paste operation has proper timing delays."""
         text = "Test prompt text"
 
@@ -108,13 +101,13 @@ class TestPasteOperations:
 
         # Verify timing delays are called with correct values
         expected_delays = [0.1, 0.3, 0.3]  # Focus, select all, paste delays
-        actual_delays = [call[0][0] for call in mock_time.sleep.call_args_list]
+        actual_delays = list(sleep_calls)
 
         # Check that we have the expected delays (allowing for some variation)
         assert len(actual_delays) >= 3
         assert all(delay >= 0.1 for delay in actual_delays[:3])
 
-    def test_paste_text_safely_with_verification(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_with_verification(self, mock_pyperclip, sleep_calls):
         """Test clipboard copy with verification."""
         text = "Test clipboard text"
 
@@ -127,7 +120,7 @@ class TestPasteOperations:
         mock_pyperclip.copy.assert_called_once_with(text)
         mock_pyperclip.paste.assert_called_once()
 
-    def test_paste_text_safely_verification_failure(self, mock_pyperclip, mock_time):
+    def test_paste_text_safely_verification_failure(self, mock_pyperclip, sleep_calls):
         """Test clipboard copy when verification fails."""
         text = "Test clipboard text"
 
@@ -139,6 +132,7 @@ class TestPasteOperations:
         assert result is False
 
 
+@pytest.mark.paste_class
 class TestNextButtonFunctionality:
     """Test cases for Next button functionality."""
 
@@ -168,6 +162,7 @@ class TestNextButtonFunctionality:
         service.stop.return_value = None
         return service
 
+    @pytest.mark.paste_smoke
     def test_next_prompt_advances_index(self, mock_ui, mock_controller):
         """Test that next_prompt advances the prompt index."""
         # Set up controller to advance successfully
@@ -240,6 +235,7 @@ class TestNextButtonFunctionality:
             mock_controller.next_prompt.assert_called_once()
 
 
+@pytest.mark.paste_class
 class TestCancelButtonFunctionality:
     """Test cases for Cancel button functionality."""
 
@@ -260,6 +256,7 @@ class TestCancelButtonFunctionality:
         controller.stop_automation.return_value = True
         return controller
 
+    @pytest.mark.paste_smoke
     def test_cancel_automation_stops_controller(self, mock_ui, mock_controller):
         """Test that cancel_automation stops the automation controller."""
         # Mock the controller in the integration layer
@@ -318,9 +315,15 @@ class TestCancelButtonFunctionality:
             mock_controller.stop_automation.assert_called_once()
 
 
+@pytest.mark.paste_class
 class TestPasteIntegration:
     """Integration tests for paste operations with UI."""
 
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self, monkeypatch):
+        """Make the controller's delays return immediately (it only uses time.sleep)."""
+        monkeypatch.setattr("src.automation_controller.time", SimpleNamespace(sleep=lambda *_: None))
+
     @pytest.fixture
     def mock_ui(self):
         """Create a mock UI for testing."""
@@ -348,13 +351,11 @@ class TestPasteIntegration:
              patch("src.dpi.enable_windows_dpi_awareness"), \
              patch("src.win_focus.CursorWindow") as mock_cursor_window, \
              patch("src.automator.pyperclip") as mock_pyperclip, \
-             patch("src.automator.pyautogui") as mock_pyautogui, \
-             patch("src.automator.time") as mock_time:
+             patch("src.automator.pyautogui") as mock_pyautogui:
 
             # Set up mocks
             mock_pyperclip.paste.return_value = "Test prompt text"
             mock_pyautogui.hotkey.return_value = None
-            mock_time.sleep.return_value = None
 
             # Create controller and set context
             controller = AutomationController(mock_ui)
@@ -378,11 +379,7 @@ class TestPasteIntegration:
              patch("src.automator.perform_paste_operation", return_value=True), \
              patch("src.automator.click_button_or_fallback", return_value=True), \
              patch("src.dpi.enable_windows_dpi_awareness"), \
-             patch("src.win_focus.CursorWindow"), \
-             patch("src.automator.time") as mock_time:
-
-            # Set up mocks
-            mock_time.sleep.return_value = None
+             patch("src.win_focus.CursorWindow"):
 
             # Create controller and set context
             controller = AutomationController(mock_ui)
@@ -396,6 +393,7 @@ class TestPasteIntegration:
             # The actual pyautogui calls happen inside perform_paste_operation which is mocked
 
 
+@pytest.mark.paste_class
 class TestNextButtonIntegration:
     """Integration tests for Next button with UI updates."""
 
@@ -11,15 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-# Import with fallback for relative import issues
-try:
-    from src.ui import SessionUI
-except ImportError:
-    # Fallback for when running tests directly
-    import os
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-    from ui import SessionUI
+from src.ui import SessionUI
 
 
 class TestThreadSafety:
@@ -10,14 +10,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-# Import with fallback for relative import issues
-try:
-    from src.ui import SessionUI
-except ImportError:
-    # Fallback for when running tests directly
-    import os
-    import sys
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from src.ui import SessionUI
 
 
 class TestSessionUI:
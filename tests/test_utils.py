@@ -5,72 +5,89 @@ Shared utilities, fixtures, and mock objects for testing the automation system.
 This module centralizes common test patterns and reduces code duplication.
 """
 
+import copy
 import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 
-def create_mock_ui_session(**kwargs) -> Mock:
+_TEST_PROMPTS = ["Test prompt 1", "Test prompt 2", "Test prompt 3"]
+
+# Getter return values shared by create_mock_ui_session() and
+# create_stub_ui_session()
+_UI_GETTERS = {
+    "get_prompts_safe": _TEST_PROMPTS,
+    "get_wait_time": 1,
+    "get_countdown_time": 2,
+    "get_coords": {
+        "input": (100, 200),
+        "submit": (300, 400),
+        "accept": (500, 600),
+    },
+    "get_timers": (5, 300, 0.2, 2.0),
+    "bring_to_front": None,
+}
+
+# Timer variable access for AutomationController: attribute -> get() value
+_UI_TIMER_VARS = {
+    "main_wait_var": "300",
+    "get_ready_delay_var": "2",
+    "start_delay_var": "5",
+    "cooldown_var": "0.2",
+}
+
+
+def _mock_getter(value):
+    return Mock(return_value=copy.copy(value))
+
+
+def _stub_getter(value):
+    def getter(*args, **kwargs):
+        return copy.copy(value)
+
+    return getter
+
+
+def _populate_ui_session(ui, make_getter, make_namespace, kwargs):
     """
-    Create a standardized mock UI session for testing.
-    
-    This factory function creates a mock UI session with all the necessary
-    attributes and methods required by the AutomationController and legacy code.
+    Set the attributes shared by both UI session factories on ui.
     
     Args:
-        **kwargs: Additional attributes to set on the mock
+        ui: Object to populate
+        make_getter: Builds a callable returning the given value
+        make_namespace: Builds a sub-object from keyword attributes
+        kwargs: Additional attributes to set last
     
     Returns:
-        Mock object configured for automation testing
+        ui
     """
-    ui = Mock()
-
-    # Mock coordinate service for AutomationController validation
-    mock_coordinate_service = Mock()
-    mock_coordinate_service.validate_coordinates.return_value = {
-        "input": True,
-        "submit": True,
-        "accept": True,
-    }
-    ui.coordinate_service = mock_coordinate_service
-
-    # Mock countdown service
-    mock_countdown_service = Mock()
-    mock_countdown_service.is_active.return_value = False
-    mock_countdown_service.is_paused.return_value = False
-    ui.countdown_service = mock_countdown_service
+    # Coordinate service for AutomationController validation
+    ui.coordinate_service = make_namespace(
+        validate_coordinates=make_getter({"input": True, "submit": True, "accept": True}),
+    )
+    ui.countdown_service = make_namespace(
+        is_active=make_getter(False),
+        is_paused=make_getter(False),
+    )
 
     # Thread safety attributes
     ui._automation_lock = threading.Lock()
     ui._prompts_locked = False
-    ui._prompts = ["Test prompt 1", "Test prompt 2", "Test prompt 3"]
+    ui._prompts = list(_TEST_PROMPTS)
 
-    # Legacy compatibility methods
-    ui.get_prompts_safe = Mock(return_value=["Test prompt 1", "Test prompt 2", "Test prompt 3"])
+    # Legacy compatibility methods; tests assert on these two, so they are
+    # Mocks in both factories
     ui.current_prompt_index = 0
     ui.update_prompt_index_from_automation = Mock()
-    ui.get_wait_time = Mock(return_value=1)
-    ui.get_countdown_time = Mock(return_value=2)
-    ui.get_coords = Mock(return_value={
-        "input": (100, 200),
-        "submit": (300, 400),
-        "accept": (500, 600),
-    })
-    ui.get_timers = Mock(return_value=(5, 300, 0.2, 2.0))
     ui.countdown = Mock(return_value={"cancelled": False})
-    ui.bring_to_front = Mock()
-
-    # Timer variable access for AutomationController
-    ui.main_wait_var = Mock()
-    ui.main_wait_var.get.return_value = "300"
-    ui.get_ready_delay_var = Mock()
-    ui.get_ready_delay_var.get.return_value = "2"
-    ui.start_delay_var = Mock()
-    ui.start_delay_var.get.return_value = "5"
-    ui.cooldown_var = Mock()
-    ui.cooldown_var.get.return_value = "0.2"
+    for name, value in _UI_GETTERS.items():
+        setattr(ui, name, make_getter(value))
+
+    for name, value in _UI_TIMER_VARS.items():
+        setattr(ui, name, make_namespace(get=make_getter(value)))
 
     # UI-specific attributes
-    ui.prompts = ["Test prompt 1", "Test prompt 2", "Test prompt 3"]
+    ui.prompts = list(_TEST_PROMPTS)
 
     # Apply any custom attributes
     for key, value in kwargs.items():
@@ -79,6 +96,40 @@ def create_mock_ui_session(**kwargs) -> Mock:
     return ui
 
 
+def create_mock_ui_session(**kwargs) -> Mock:
+    """
+    Create a standardized mock UI session for testing.
+    
+    This factory function creates a mock UI session with all the necessary
+    attributes and methods required by the AutomationController and legacy code.
+    
+    Args:
+        **kwargs: Additional attributes to set on the mock
+    
+    Returns:
+        Mock object configured for automation testing
+    """
+    return _populate_ui_session(Mock(), _mock_getter, Mock, kwargs)
+
+
+def create_stub_ui_session(**kwargs) -> SimpleNamespace:
+    """
+    Create a lightweight UI session stub for tests that only read from the UI.
+    
+    Value holders are plain attributes and getters are plain functions, which
+    are much cheaper to build and call than Mock attributes. Only the methods
+    tests assert on (update_prompt_index_from_automation, countdown) are Mocks.
+    Unlike create_mock_ui_session(), unknown attributes raise AttributeError.
+    
+    Args:
+        **kwargs: Additional attributes to set on the stub
+    
+    Returns:
+        SimpleNamespace configured like create_mock_ui_session()
+    """
+    return _populate_ui_session(SimpleNamespace(), _stub_getter, SimpleNamespace, kwargs)
+
+
 def mock_automation_controller_success():
     """
     Create a mock AutomationController that returns success.
@@ -165,5 +216,6 @@ RECOMMENDED_PATTERNS = [
     "Use mock_automation_controller_success() for successful automation tests",
     "Use mock_automation_controller_failure() for failed automation tests",
     "Use create_mock_ui_session() for standardized UI mocks",
+    "Use create_stub_ui_session() when a test only reads from the UI",
     "Use AutomationTestMixin for common test utilities",
 ]